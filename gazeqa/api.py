@@ -3,7 +3,6 @@ from __future__ import annotations
 
 import hashlib
 import hmac
-import json
 import logging
 import os
 import queue
@@ -11,7 +10,7 @@ import ssl
 import threading
 import time
 import urllib.parse
-from datetime import datetime, timezone
+from datetime import datetime
 from functools import partial
 from http import HTTPStatus
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
@@ -22,13 +21,15 @@ from .auth import build_auth_orchestrator
 from .audit import AuditLogger
 from .bfs import BFSCrawler, CrawlConfig
 from .discovery import discover_site_map
+from .json_utils import dumps, loads
 from .exploration import ExplorationConfig, ExplorationEngine
 from .langfuse import LangfuseClient
 from .models import ValidationError
 from .observability import RunObservability
 from .run_service import RunService
 from .security import DEFAULT_OPEN_SCOPES, SecretsManager, SigningKeySet
-from .workflow import RunWorkflow
+from .telemetry import AsyncTelemetrySink
+from .workflow import RetryPolicy, RunWorkflow
 
 
 logger = logging.getLogger(__name__)
@@ -271,7 +272,7 @@ class RunRequestHandler(BaseHTTPRequestHandler):
                 "organization": "default",
                 "organization_slug": "default",
                 "actor_role": "system",
-                "scopes": sorted(DEFAULT_OPEN_SCOPES),
+                "scopes": DEFAULT_OPEN_SCOPES,
             }
         principal = self._authenticate(query)
         if principal is None:
@@ -330,12 +331,12 @@ class RunRequestHandler(BaseHTTPRequestHandler):
         if not raw:
             return {}, False
         try:
-            return json.loads(raw.decode("utf-8")), True
-        except json.JSONDecodeError:
+            return loads(raw), True
+        except ValueError:
             return {}, False
 
     def _send_json(self, data: dict, status: int = HTTPStatus.OK) -> None:
-        body = json.dumps(data).encode("utf-8")
+        body = dumps(data)
         self.send_response(status)
         self._set_base_headers()
         self._set_cors_headers()
@@ -425,7 +426,7 @@ class RunRequestHandler(BaseHTTPRequestHandler):
                     self._send_artifacts(manifest, parsed.query, principal)
                     return
                 if len(segments) == 4 and segments[3] == "events":
-                    self._send_run_events(run_id)
+                    self._send_run_events(run_id, parsed.query)
                     return
             self.send_error(HTTPStatus.NOT_FOUND, "Not Found")
             return
@@ -629,11 +630,12 @@ class RunRequestHandler(BaseHTTPRequestHandler):
             or (principal or {}).get("organization_slug")
             or "default"
         )
+        # Every link on the page shares one expiry instead of reading the clock per entry.
+        expires = int(time.time()) + self.SIGNING_TTL
         for entry in slice_original:
             entry_copy = dict(entry)
             relative_path = entry_copy.get("path", "")
             if primary_key and run_id and relative_path:
-                expires = int(datetime.now(timezone.utc).timestamp()) + self.SIGNING_TTL
                 signature = _sign_path(
                     primary_key,
                     run_id,
@@ -706,7 +708,7 @@ class RunRequestHandler(BaseHTTPRequestHandler):
             )
             self._send_json({"error": "invalid expires"}, status=HTTPStatus.BAD_REQUEST)
             return
-        now = int(datetime.now(timezone.utc).timestamp())
+        now = int(time.time())
         if expires_int < now:
             self._audit(
                 "artifact.download",
@@ -815,9 +817,31 @@ class RunRequestHandler(BaseHTTPRequestHandler):
         self._audit("alert.received", metadata=metadata)
         self._send_json({"status": "accepted"}, status=HTTPStatus.ACCEPTED)
 
-    def _send_run_events(self, run_id: str) -> None:
+    def _send_run_events(self, run_id: str, query: str = "") -> None:
+        # ``limit``, ``tail`` and ``since`` are applied while the log is read,
+        # so a bounded response never holds more than ``limit`` events.
+        params = urllib.parse.parse_qs(query)
         try:
-            events = self.run_service.get_run_events(run_id)
+            limit = int(params["limit"][0]) if "limit" in params else None
+        except ValueError:
+            self._send_json({"error": "limit must be an integer"}, status=HTTPStatus.BAD_REQUEST)
+            return
+        tail = params.get("tail", ["false"])[0].lower() in {"1", "true", "yes"}
+        since_param = params.get("since", [None])[0]
+        try:
+            since = datetime.fromisoformat(since_param) if since_param is not None else None
+        except ValueError:
+            self._send_json({"error": "since must be an ISO 8601 timestamp"}, status=HTTPStatus.BAD_REQUEST)
+            return
+        try:
+            events = list(
+                self.run_service.iter_run_events(
+                    run_id,
+                    limit=max(0, limit) if limit is not None else None,
+                    since_ts=since,
+                    tail=tail,
+                )
+            )
             history = self.run_service.get_status_history(run_id)
         except FileNotFoundError:
             self._send_json({"error": "not_found"}, status=HTTPStatus.NOT_FOUND)
@@ -853,8 +877,7 @@ class RunRequestHandler(BaseHTTPRequestHandler):
         self.end_headers()
 
         def write_event(event: dict) -> None:
-            payload = json.dumps(event)
-            self.wfile.write(f"event: status\ndata: {payload}\n\n".encode("utf-8"))
+            self.wfile.write(b"event: status\ndata: " + dumps(event) + b"\n\n")
             self.wfile.flush()
 
         try:
@@ -909,6 +932,7 @@ def serve(
             if key.strip()
         ],
         signing_key_file=os.getenv("GAZEQA_SIGNING_KEY_FILE"),
+        stat_ttl=float(os.getenv("GAZEQA_SECRETS_STAT_TTL", "0.5")),
     )
     auth_orchestrator = build_auth_orchestrator(storage_path)
     run_service = RunService(
@@ -919,13 +943,24 @@ def serve(
     exploration_engine = ExplorationEngine(ExplorationConfig(storage_root=storage_path))
     crawler = BFSCrawler(CrawlConfig(storage_root=storage_path))
     langfuse_client = LangfuseClient.from_env()
-    telemetry = RunObservability(storage_root=storage_path, langfuse_client=langfuse_client)
+    # Metrics, log writes and Langfuse forwarding all happen on the sink's
+    # worker, off the workflow thread, so RunObservability needs no queue of
+    # its own.
+    telemetry = AsyncTelemetrySink(
+        RunObservability(
+            storage_root=storage_path,
+            langfuse_client=langfuse_client,
+            langfuse_async=False,
+        )
+    )
     site_map_builder = partial(discover_site_map, storage_root=storage_path)
     workflow = RunWorkflow(
         run_service,
         auth_orchestrator,
         exploration_engine,
         crawler,
+        # The server retries with backoff; library callers default to immediate retries.
+        retry_policy=RetryPolicy(initial_interval=1.0),
         telemetry=telemetry,
         site_map_builder=site_map_builder,
     )
@@ -2,11 +2,12 @@
 from __future__ import annotations
 
 import hashlib
-import json
+import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Iterable
+from typing import Dict, Iterable, Iterator, Tuple
 
+from .json_utils import dumps
 from .path_utils import resolve_run_path
 
 
@@ -40,13 +41,10 @@ class ArtifactManifestBuilder:
         run_dir = self._resolve_run_dir(run_id, organization_slug)
         include = set(include_patterns or [])
         entries: list[ArtifactEntry] = []
-        for path in run_dir.rglob("*"):
-            if path.is_dir():
+        for entry, relative in _iter_files(os.fspath(run_dir), ""):
+            if include and not any(relative.startswith(pattern) for pattern in include):
                 continue
-            relative = path.relative_to(run_dir)
-            if include and not any(relative.as_posix().startswith(pattern) for pattern in include):
-                continue
-            entries.append(self._make_entry(path, relative))
+            entries.append(self._make_entry(entry, relative))
         from datetime import datetime, timezone
         manifest = {
             "run_id": run_id,
@@ -56,16 +54,17 @@ class ArtifactManifestBuilder:
         self._write_manifest(run_dir, manifest)
         return manifest
 
-    def _make_entry(self, path: Path, relative: Path) -> ArtifactEntry:
-        size = path.stat().st_size
-        checksum = hashlib.sha256(path.read_bytes()).hexdigest()
-        return ArtifactEntry(relative, size, checksum)
+    def _make_entry(self, entry: os.DirEntry[str], relative: str) -> ArtifactEntry:
+        size = entry.stat().st_size
+        with open(entry.path, "rb") as handle:
+            checksum = hashlib.sha256(handle.read()).hexdigest()
+        return ArtifactEntry(Path(relative), size, checksum)
 
     def _write_manifest(self, run_dir: Path, manifest: Dict[str, object]) -> None:
         manifest_dir = run_dir / "artifacts"
         manifest_dir.mkdir(parents=True, exist_ok=True)
         manifest_path = manifest_dir / "index.json"
-        manifest_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+        manifest_path.write_bytes(dumps(manifest, indent=True))
 
     def _resolve_run_dir(self, run_id: str, organization_slug: str | None) -> Path:
         if organization_slug:
@@ -78,4 +77,21 @@ class ArtifactManifestBuilder:
         raise FileNotFoundError(f"Run directory not found for {run_id}")
 
 
+def _iter_files(directory: str, prefix: str) -> Iterator[Tuple[os.DirEntry[str], str]]:
+    """Yield ``(entry, posix_relative_path)`` for every file below ``directory``.
+
+    ``os.scandir`` reports entry types from the directory listing, so no
+    per-entry ``stat`` is needed to tell files from directories.
+    """
+
+    with os.scandir(directory) as entries:
+        children = list(entries)
+    for entry in children:
+        relative = prefix + entry.name
+        if entry.is_dir():
+            yield from _iter_files(entry.path, relative + "/")
+        elif entry.is_file():
+            yield entry, relative
+
+
 __all__ = ["ArtifactManifestBuilder", "ArtifactEntry"]
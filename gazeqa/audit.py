@@ -2,13 +2,14 @@
 from __future__ import annotations
 
 import hashlib
-import json
 import logging
 from datetime import datetime, timezone
 from pathlib import Path
 from threading import Lock
 from typing import Any, Dict, Optional
 
+from .json_utils import dumps_line
+
 logger = logging.getLogger(__name__)
 
 
@@ -51,11 +52,11 @@ class AuditLogger:
             entry["metadata"] = metadata
         if remote_addr:
             entry["remote_addr"] = remote_addr
-        payload = json.dumps(entry, sort_keys=True)
+        payload = dumps_line(entry, sort_keys=True)
         with self._lock:
             try:
-                with self._path.open("a", encoding="utf-8") as handle:
-                    handle.write(payload + "\n")
+                with self._path.open("ab") as handle:
+                    handle.write(payload)
             except OSError as exc:
                 logger.error("Failed to write audit log %s: %s", self._path, exc)
 
@@ -1,9 +1,9 @@
 """Authentication orchestration and concrete integrations for FR-002."""
 from __future__ import annotations
 
-import json
 import logging
 import os
+import threading
 import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
@@ -11,7 +11,10 @@ from pathlib import Path
 from typing import Any, Callable, Dict, Iterable, Optional, Sequence
 
 import requests
+from requests.adapters import HTTPAdapter
 
+from .file_utils import atomic_write_bytes
+from .json_utils import dumps as json_dumps
 from .models import CredentialSpec
 
 logger = logging.getLogger(__name__)
@@ -26,7 +29,7 @@ class AuthAttempt:
     """Represents the outcome of a single authentication attempt."""
 
     success: bool
-    storage_state: Optional[str]
+    storage_state: Optional[bytes | str]
     evidence: list[str] = field(default_factory=list)
     metadata: dict[str, Any] = field(default_factory=dict)
     error: Optional[str] = None
@@ -72,13 +75,21 @@ class AuthConfig:
 class StorageEncryptor:
     """Encrypts storage state payloads before persistence."""
 
-    def encrypt_and_write(self, plaintext: str, target: Path) -> Path:  # pragma: no cover - interface
+    __slots__ = ()
+
+    def encrypt_and_write(self, plaintext: bytes | str, target: Path) -> Path:  # pragma: no cover - interface
         raise NotImplementedError
 
 
+def _as_bytes(payload: bytes | str) -> bytes:
+    return payload.encode("utf-8") if isinstance(payload, str) else payload
+
+
 class FernetStorageEncryptor(StorageEncryptor):
     """Encrypts storage state using Fernet symmetric encryption."""
 
+    __slots__ = ("_fernet",)
+
     def __init__(self, key: str) -> None:
         try:
             from cryptography.fernet import Fernet
@@ -89,10 +100,8 @@ class FernetStorageEncryptor(StorageEncryptor):
         key_bytes = key.encode("utf-8") if isinstance(key, str) else key
         self._fernet = Fernet(key_bytes)
 
-    def encrypt_and_write(self, plaintext: str, target: Path) -> Path:
-        token = self._fernet.encrypt(plaintext.encode("utf-8"))
-        target.parent.mkdir(parents=True, exist_ok=True)
-        target.write_bytes(token)
+    def encrypt_and_write(self, plaintext: bytes | str, target: Path) -> Path:
+        atomic_write_bytes(target, self._fernet.encrypt(_as_bytes(plaintext)))
         return target
 
     def decrypt(self, source: Path) -> str:
@@ -103,9 +112,10 @@ class FernetStorageEncryptor(StorageEncryptor):
 class PlaintextStorageWriter(StorageEncryptor):
     """Fallback writer that stores plaintext (discouraged)."""
 
-    def encrypt_and_write(self, plaintext: str, target: Path) -> Path:
-        target.parent.mkdir(parents=True, exist_ok=True)
-        target.write_text(plaintext, encoding="utf-8")
+    __slots__ = ()
+
+    def encrypt_and_write(self, plaintext: bytes | str, target: Path) -> Path:
+        atomic_write_bytes(target, _as_bytes(plaintext))
         return target
 
 
@@ -159,14 +169,15 @@ class AuthenticationOrchestrator:
             final_stage = "fallback"
             final_attempt = fallback_attempt
 
+        final_entry = attempts_log[-1]
         result: dict[str, Any] = {
             "run_id": run_id,
             "stage": final_stage,
             "success": final_attempt.success,
             "timestamp": datetime.now(timezone.utc).isoformat(),
             "storage_state_path": None,
-            "evidence": list(final_attempt.evidence),
-            "metadata": final_attempt.metadata,
+            "evidence": list(final_entry["evidence"]),
+            "metadata": dict(final_entry["metadata"]),
             "attempts": attempts_log,
         }
 
@@ -218,7 +229,7 @@ class AuthenticationOrchestrator:
 
     def _persist_log(self, evidence_dir: Path, result: dict[str, Any]) -> None:
         log_path = evidence_dir / "auth_result.json"
-        log_path.write_text(json.dumps(result, indent=2), encoding="utf-8")
+        atomic_write_bytes(log_path, json_dumps(result, indent=True))
 
     @staticmethod
     def _attempt_to_dict(stage: str, attempt: AuthAttempt) -> dict[str, Any]:
@@ -238,6 +249,24 @@ class AuthenticationOrchestrator:
 
 _BROWSERBASE_API_BASE = "https://api.browserbase.com/v1"
 
+_browserbase_session: requests.Session | None = None
+_browserbase_session_lock = threading.Lock()
+
+
+def _get_browserbase_session() -> requests.Session:
+    """Return the shared keep-alive session used for Browserbase API calls."""
+
+    global _browserbase_session
+    if _browserbase_session is None:
+        with _browserbase_session_lock:
+            if _browserbase_session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=8)
+                session.mount("https://", adapter)
+                session.headers["Content-Type"] = "application/json"
+                _browserbase_session = session
+    return _browserbase_session
+
 
 def browserbase_cua_login(
     run_id: str,
@@ -261,13 +290,8 @@ def browserbase_cua_login(
             error="browserbase_start_url missing from AuthConfig",
         )
 
-    session = requests.Session()
-    session.headers.update(
-        {
-            "Authorization": f"Bearer {config.browserbase_api_key}",
-            "Content-Type": "application/json",
-        }
-    )
+    session = _get_browserbase_session()
+    headers = {"Authorization": f"Bearer {config.browserbase_api_key}"}
 
     payload: Dict[str, Any] = {
         "project_id": config.browserbase_project_id,
@@ -291,6 +315,7 @@ def browserbase_cua_login(
         create_resp = session.post(
             f"{_BROWSERBASE_API_BASE}/sessions",
             json=payload,
+            headers=headers,
             timeout=timeout,
         )
         create_resp.raise_for_status()
@@ -309,7 +334,9 @@ def browserbase_cua_login(
         time.sleep(3)
         try:
             status_resp = session.get(
-                f"{_BROWSERBASE_API_BASE}/sessions/{session_id}", timeout=15
+                f"{_BROWSERBASE_API_BASE}/sessions/{session_id}",
+                headers=headers,
+                timeout=15,
             )
             status_resp.raise_for_status()
             status_info = status_resp.json()
@@ -323,14 +350,15 @@ def browserbase_cua_login(
     if status != "completed":
         return AuthAttempt(success=False, storage_state=None, metadata=metadata)
 
-    storage_state: Optional[str] = None
+    storage_state: Optional[bytes] = None
     try:
         storage_resp = session.get(
             f"{_BROWSERBASE_API_BASE}/sessions/{session_id}/storage-state",
+            headers=headers,
             timeout=30,
         )
         storage_resp.raise_for_status()
-        storage_state = storage_resp.text
+        storage_state = storage_resp.content
     except requests.RequestException as exc:
         logger.error("Fetching Browserbase storage state failed: %s", exc)
         return AuthAttempt(success=False, storage_state=None, error=str(exc), metadata=metadata)
@@ -339,6 +367,7 @@ def browserbase_cua_login(
     try:
         screenshot_resp = session.get(
             f"{_BROWSERBASE_API_BASE}/sessions/{session_id}/screenshot",
+            headers=headers,
             timeout=30,
         )
         if screenshot_resp.ok:
@@ -407,8 +436,7 @@ def playwright_fallback_login(
                 except PlaywrightTimeoutError:
                     metadata.setdefault("missing_selectors", []).append(selector)
 
-            storage_state_dict = context.storage_state()
-            storage_state = json.dumps(storage_state_dict)
+            storage_state = json_dumps(context.storage_state())
 
             screenshot_path = evidence_dir / "playwright_post_login.png"
             page.screenshot(path=screenshot_path)
@@ -424,20 +452,26 @@ def playwright_fallback_login(
     return AuthAttempt(success=True, storage_state=storage_state, evidence=evidence, metadata=metadata)
 
 
-def _fill_first_selector(page: Any, selectors: Iterable[str], value: str) -> None:
+def _fill_first_selector(
+    page: Any, selectors: Iterable[str], value: str, *, timeout_ms: int = 2000
+) -> None:
+    # Selectors are tried in configured priority order, each with a short
+    # timeout; they may use any Playwright engine (text=, xpath=, >> chains).
+    selectors = tuple(selectors)
     for selector in selectors:
         try:
-            page.fill(selector, value)
+            page.locator(selector).first.fill(value, timeout=timeout_ms)
             return
         except Exception:  # pragma: no cover - attempt next selector
             continue
     raise AuthenticationError(f"Unable to fill any selector from {selectors}")
 
 
-def _click_first_selector(page: Any, selectors: Iterable[str]) -> None:
+def _click_first_selector(page: Any, selectors: Iterable[str], *, timeout_ms: int = 2000) -> None:
+    selectors = tuple(selectors)
     for selector in selectors:
         try:
-            page.click(selector)
+            page.locator(selector).first.click(timeout=timeout_ms)
             return
         except Exception:  # pragma: no cover - try next selector
             continue
@@ -1,21 +1,33 @@
 """Deterministic BFS crawler scaffold for FR-004 with FR-016 guardrails."""
 from __future__ import annotations
 
-import json
 import logging
-from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from itertools import repeat
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
-from .exploration import PageDescriptor
-from .telemetry import NoOpTelemetry, TelemetrySink
+from .exploration import GuardrailEvent, PageDescriptor
+from .file_utils import atomic_write_bytes
+from .json_utils import dumps, dumps_line
+from .keywords import KeywordMatcher
+from .telemetry import NoOpTelemetry, TelemetryBatcher, TelemetrySink
 from .path_utils import resolve_run_path
 
 
 logger = logging.getLogger(__name__)
 
+_TELEMETRY_QUEUE_SIZE = 1024
+_TELEMETRY_BATCH_SIZE = 64
+_TELEMETRY_IDLE_SECONDS = 1.0
+_EMPTY: Tuple[PageDescriptor, ...] = ()
+_PARALLEL_CLASSIFY_MIN = 256
+
+# (skip reason, matched destructive keyword) or None when the page may be visited.
+_Verdict = Optional[Tuple[str, Optional[str]]]
+
 
 @dataclass(slots=True)
 class CrawlConfig:
@@ -32,6 +44,7 @@ class CrawlConfig:
         "wipe",
     )
     guardrail_log_name: str = "guardrails.jsonl"
+    expansion_workers: int = 0
 
 
 @dataclass(slots=True)
@@ -96,157 +109,206 @@ class BFSCrawler:
     ) -> None:
         self.config = config or CrawlConfig()
         self.telemetry = telemetry or NoOpTelemetry()
+        self._skip_keywords = KeywordMatcher(self.config.skip_keywords)
+        self._destructive_keywords = KeywordMatcher(self.config.destructive_keywords)
+        self._telemetry_batcher = TelemetryBatcher(
+            self.telemetry,
+            name="bfs-telemetry",
+            max_queue=_TELEMETRY_QUEUE_SIZE,
+            batch_size=_TELEMETRY_BATCH_SIZE,
+            batch_window=0,
+            idle_seconds=_TELEMETRY_IDLE_SECONDS,
+        )
 
     def crawl(
         self,
         run_id: str,
         seeds: Iterable[PageDescriptor],
-        adjacency: Dict[str, List[PageDescriptor]],
+        adjacency: Dict[str, Sequence[PageDescriptor]],
+        *,
+        run_dir: Path | None = None,
     ) -> CrawlResult:
+        """Crawl from ``seeds``; pass ``run_dir`` when the caller already resolved it."""
+
+        # One timestamp covers the whole crawl, including its guardrail events.
         timestamp = datetime.now(timezone.utc).isoformat()
-        visited: Dict[str, CrawlRecord] = {}
+        visited_keys: set[str] = set()
+        visited: List[CrawlRecord] = []
         skipped: List[SkipRecord] = []
-        guardrail_events: List[Dict[str, object]] = []
-
-        queue: deque[Tuple[PageDescriptor, int, Optional[PageDescriptor]]] = deque(
-            (seed, 0, None) for seed in seeds
+        page_map = bytearray()
+        guardrail_log = bytearray()
+
+        # Level-synchronous BFS: parallel lists hold the frontier pages and
+        # their parents; the depth is shared by every entry in a level.
+        frontier: List[PageDescriptor] = list(seeds)
+        parents: List[Optional[PageDescriptor]] = [None] * len(frontier)
+        depth = 0
+        halted = False
+        limit = self.config.max_nodes_per_run
+        # With the no-op sink no guardrail payload is built or queued.
+        telemetry_on = not isinstance(self.telemetry, NoOpTelemetry)
+        workers = self.config.expansion_workers
+        executor = (
+            ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bfs-classify")
+            if workers > 1
+            else None
         )
 
-        while queue:
-            page, depth, parent = queue.popleft()
-            key = page.url.lower()
-            if key in visited:
-                continue
-
-            if self._rate_limited(len(visited)):
-                guardrail_events.append(
-                    self._guardrail_event(run_id, "rate_limit", page, depth, parent)
-                )
-                skipped.append(
-                    SkipRecord(
-                        url=page.url,
-                        reason="rate_limited",
-                        source_page_id=parent.page_id if parent else None,
-                        source_url=parent.url if parent else None,
-                    )
-                )
-                self._emit(
-                    "guardrail.rate_limit",
-                    {
-                        "run_id": run_id,
-                        "phase": "crawl",
-                        "url": page.url,
-                        "limit": self.config.max_nodes_per_run,
-                    },
-                )
-                break
-
-            keyword = self._match_keyword(page)
-            if keyword:
-                guardrail_events.append(
-                    self._guardrail_event(run_id, "blocklist", page, depth, parent, keyword=keyword)
-                )
-                skipped.append(
-                    SkipRecord(
-                        url=page.url,
-                        reason="destructive_blocklist",
-                        source_page_id=parent.page_id if parent else None,
-                        source_url=parent.url if parent else None,
-                    )
-                )
-                self._emit(
-                    "guardrail.blocklist",
-                    {
-                        "run_id": run_id,
-                        "phase": "crawl",
-                        "url": page.url,
-                        "keyword": keyword,
-                    },
-                )
-                continue
-
-            if self._should_skip(page):
-                skipped.append(
-                    SkipRecord(
-                        url=page.url,
-                        reason="skip_keyword_match",
-                        source_page_id=parent.page_id if parent else None,
-                        source_url=parent.url if parent else None,
-                    )
-                )
-                continue
-
-            record = CrawlRecord(page=page, depth=depth, source_page_id=parent.page_id if parent else None)
-            visited[key] = record
-
-            if depth >= self.config.max_depth:
-                continue
-
-            children = adjacency.get(page.page_id or page.url, [])
-            for child in children:
-                queue.append((child, depth + 1, page))
-
+        try:
+            while frontier and not halted:
+                next_frontier: List[PageDescriptor] = []
+                next_parents: List[Optional[PageDescriptor]] = []
+                verdicts = self._classify_level(frontier, visited_keys, executor)
+                for page, parent in zip(frontier, parents):
+                    key = page.url_lower
+                    if key in visited_keys:
+                        continue
+
+                    if limit > 0 and len(visited) >= limit:
+                        guardrail_log += dumps_line(
+                            self._guardrail_event(
+                                run_id, "rate_limit", page, depth, parent, timestamp
+                            ).to_artifact()
+                        )
+                        skipped.append(
+                            SkipRecord(
+                                url=page.url,
+                                reason="rate_limited",
+                                source_page_id=parent.page_id if parent else None,
+                                source_url=parent.url if parent else None,
+                            )
+                        )
+                        if telemetry_on:
+                            self._emit(
+                                "guardrail.rate_limit",
+                                {
+                                    "run_id": run_id,
+                                    "phase": "crawl",
+                                    "url": page.url,
+                                    "limit": limit,
+                                },
+                            )
+                        halted = True
+                        break
+
+                    verdict = verdicts[id(page)]
+                    if verdict is not None:
+                        reason, keyword = verdict
+                        if keyword:
+                            guardrail_log += dumps_line(
+                                self._guardrail_event(
+                                    run_id,
+                                    "blocklist",
+                                    page,
+                                    depth,
+                                    parent,
+                                    timestamp,
+                                    keyword=keyword,
+                                ).to_artifact()
+                            )
+                            if telemetry_on:
+                                self._emit(
+                                    "guardrail.blocklist",
+                                    {
+                                        "run_id": run_id,
+                                        "phase": "crawl",
+                                        "url": page.url,
+                                        "keyword": keyword,
+                                    },
+                                )
+                        skipped.append(
+                            SkipRecord(
+                                url=page.url,
+                                reason=reason,
+                                source_page_id=parent.page_id if parent else None,
+                                source_url=parent.url if parent else None,
+                            )
+                        )
+                        continue
+
+                    record = CrawlRecord(page=page, depth=depth, source_page_id=parent.page_id if parent else None)
+                    visited_keys.add(key)
+                    visited.append(record)
+                    page_map += dumps_line(record.to_artifact())
+
+                    if depth >= self.config.max_depth:
+                        continue
+
+                    children = adjacency.get(page.key, _EMPTY)
+                    if children:
+                        next_frontier.extend(children)
+                        next_parents.extend(repeat(page, len(children)))
+
+                frontier = next_frontier
+                parents = next_parents
+                depth += 1
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+
+        self._flush_telemetry()
         result = CrawlResult(
             run_id=run_id,
-            visited=list(visited.values()),
+            visited=visited,
             skipped=skipped,
             timestamp=timestamp,
         )
-        self._persist(run_id, result, guardrail_events)
+        self._persist(run_id, result, page_map, guardrail_log, run_dir)
         return result
 
+    def _classify_level(
+        self,
+        frontier: List[PageDescriptor],
+        visited_keys: set[str],
+        executor: ThreadPoolExecutor | None,
+    ) -> Dict[int, _Verdict]:
+        """Classify every not-yet-visited page of a level in one batch, keyed by ``id(page)``."""
+
+        pending: Dict[int, PageDescriptor] = {}
+        for page in frontier:
+            if page.url_lower not in visited_keys:
+                pending.setdefault(id(page), page)
+        pages = list(pending.values())
+        if executor is not None and len(pages) >= _PARALLEL_CLASSIFY_MIN:
+            verdicts = executor.map(self._classify, pages, chunksize=64)
+        else:
+            verdicts = map(self._classify, pages)
+        return dict(zip(pending, verdicts))
+
+    def _classify(self, page: PageDescriptor) -> _Verdict:
+        keyword = self._destructive_keywords.first_match(page.url_lower, page.title_lower)
+        if keyword:
+            return "destructive_blocklist", keyword
+        if self._should_skip(page):
+            return "skip_keyword_match", None
+        return None
+
     def _should_skip(self, page: PageDescriptor) -> bool:
-        if not page.url:
-            return False
-        lower = page.url.lower()
-        return any(keyword in lower for keyword in self.config.skip_keywords)
+        return bool(page.url_lower) and self._skip_keywords.matches(page.url_lower)
 
     def _persist(
         self,
         run_id: str,
         result: CrawlResult,
-        guardrail_events: List[Dict[str, object]],
+        page_map: bytes,
+        guardrail_log: bytes,
+        run_dir: Path | None = None,
     ) -> None:
-        run_dir = resolve_run_path(self.config.storage_root, run_id) / "bfs"
-        run_dir.mkdir(parents=True, exist_ok=True)
-
-        page_map_path = run_dir / "page_map.jsonl"
-        page_map_path.write_text(
-            "".join(json.dumps(record.to_artifact()) + "\n" for record in result.visited),
-            encoding="utf-8",
+        if run_dir is None:
+            run_dir = resolve_run_path(self.config.storage_root, run_id)
+        run_dir = run_dir / "bfs"
+
+        atomic_write_bytes(run_dir / "page_map.jsonl", page_map)
+        atomic_write_bytes(
+            run_dir / "skipped_links.json",
+            dumps([record.to_artifact() for record in result.skipped], indent=True),
         )
-
-        skipped_path = run_dir / "skipped_links.json"
-        skipped_path.write_text(
-            json.dumps([record.to_artifact() for record in result.skipped], indent=2),
-            encoding="utf-8",
+        atomic_write_bytes(
+            run_dir / "coverage_merge.json",
+            dumps(result.to_summary(), indent=True),
         )
-
-        coverage_path = run_dir / "coverage_merge.json"
-        coverage_path.write_text(
-            json.dumps(result.to_summary(), indent=2),
-            encoding="utf-8",
-        )
-        if guardrail_events:
-            guardrail_path = run_dir / self.config.guardrail_log_name
-            guardrail_path.write_text(
-                "".join(json.dumps(event) + "\n" for event in guardrail_events),
-                encoding="utf-8",
-            )
-
-    def _match_keyword(self, page: PageDescriptor) -> str | None:
-        keywords = [kw.lower() for kw in self.config.destructive_keywords]
-        haystack = f"{page.url} {page.title}".lower()
-        for keyword in keywords:
-            if keyword and keyword in haystack:
-                return keyword
-        return None
-
-    def _rate_limited(self, visited_count: int) -> bool:
-        limit = self.config.max_nodes_per_run
-        if limit <= 0:
-            return False
-        return visited_count >= limit
+        if guardrail_log:
+            atomic_write_bytes(run_dir / self.config.guardrail_log_name, guardrail_log)
 
     def _guardrail_event(
         self,
@@ -255,32 +317,32 @@ class BFSCrawler:
         page: PageDescriptor,
         depth: int,
         parent: Optional[PageDescriptor],
+        timestamp: str,
         *,
         keyword: str | None = None,
-    ) -> Dict[str, object]:
-        payload: Dict[str, object] = {
-            "run_id": run_id,
-            "phase": "crawl",
-            "type": event_type,
-            "url": page.url,
-            "title": page.title,
-            "depth": depth,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-        }
-        if parent:
-            payload["source_page_id"] = parent.page_id
-            payload["source_url"] = parent.url
-        if keyword:
-            payload["keyword"] = keyword
-        if event_type == "rate_limit":
-            payload["limit"] = self.config.max_nodes_per_run
-        return payload
+    ) -> GuardrailEvent:
+        return GuardrailEvent(
+            run_id=run_id,
+            phase="crawl",
+            type=event_type,
+            url=page.url,
+            title=page.title,
+            timestamp=timestamp,
+            depth=depth,
+            source_page_id=parent.page_id if parent else None,
+            source_url=parent.url if parent else None,
+            keyword=keyword,
+            limit=self.config.max_nodes_per_run if event_type == "rate_limit" else None,
+        )
 
     def _emit(self, event: str, payload: Dict[str, object]) -> None:
-        try:
-            self.telemetry.emit(event, payload)
-        except Exception:  # pragma: no cover - defensive log
-            logger.exception("bfs telemetry emit failed: %s", event)
+        if not self._telemetry_batcher.put(event, payload):
+            logger.warning("bfs telemetry queue full; dropping event %s", event)
+
+    def _flush_telemetry(self) -> None:
+        """Block until queued telemetry has been handed to the sink."""
+
+        self._telemetry_batcher.join()
 
 
 __all__ = ["BFSCrawler", "CrawlConfig", "CrawlResult", "CrawlRecord", "SkipRecord"]
@@ -1,13 +1,13 @@
 """Deterministic BFS crawl scaffold (FR-004)."""
 from __future__ import annotations
 
-import json
 from collections import deque
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Iterable, Set, Dict
 
+from .json_utils import dumps
 from .path_utils import resolve_run_path
 
 
@@ -71,9 +71,7 @@ class BFSCrawler:
     def _persist(self, run_id: str, result: CrawlResult) -> None:
         crawl_dir = resolve_run_path(self.config.storage_root, run_id) / "crawl"
         crawl_dir.mkdir(parents=True, exist_ok=True)
-        (crawl_dir / "crawl_result.json").write_text(
-            json.dumps(result.to_dict(), indent=2), encoding="utf-8"
-        )
+        (crawl_dir / "crawl_result.json").write_bytes(dumps(result.to_dict(), indent=True))
 
 
 __all__ = ["BFSCrawler", "CrawlConfig", "CrawlResult"]
@@ -1,27 +1,32 @@
 """Site discovery helpers using Playwright capture."""
 from __future__ import annotations
 
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Iterable, List, Sequence, Tuple
-from urllib.parse import urljoin, urlparse
+from urllib.parse import ParseResult, urlparse
 
 from .exploration import PageDescriptor
+from .file_utils import ensure_dir
 from .models import CreateRunPayload
 from .site_map import build_default_site_map
 from .path_utils import resolve_run_path
 
 logger = logging.getLogger(__name__)
 
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
 try:  # pragma: no cover - import guard
-    from playwright.sync_api import (  # type: ignore
+    from playwright.async_api import (  # type: ignore
         TimeoutError as PlaywrightTimeoutError,
-        sync_playwright as _sync_playwright,
+        async_playwright as _async_playwright,
     )
 except Exception:  # pragma: no cover - environment without Playwright
     PlaywrightTimeoutError = Exception  # type: ignore
-    _sync_playwright = None
+    _async_playwright = None
 
 
 @dataclass(slots=True)
@@ -38,8 +43,10 @@ class DiscoveryConfig:
     )
     screenshot_dir: str = "capture/screenshots"
     dom_dir: str = "capture/dom"
-    wait_for: str = "networkidle"
+    wait_until: str = "domcontentloaded"
+    wait_for: str | None = None
     timeout_ms: int = 15000
+    concurrency: int = 4
 
 
 class SiteDiscoveryError(RuntimeError):
@@ -76,18 +83,33 @@ def _discover_with_playwright(
     payload: CreateRunPayload,
     config: DiscoveryConfig,
 ) -> Tuple[List[PageDescriptor], Dict[str, List[PageDescriptor]]]:
-    if _sync_playwright is None:  # pragma: no cover - environment guard
+    if _async_playwright is None:  # pragma: no cover - environment guard
         raise SiteDiscoveryError("Playwright runtime not available")
-
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(_discover_with_playwright_async(run_id, payload, config))
+    # asyncio.run() cannot nest inside a running loop, so give discovery a
+    # loop of its own on a worker thread.
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="discovery") as pool:
+        return pool.submit(
+            asyncio.run, _discover_with_playwright_async(run_id, payload, config)
+        ).result()
+
+
+async def _discover_with_playwright_async(
+    run_id: str,
+    payload: CreateRunPayload,
+    config: DiscoveryConfig,
+) -> Tuple[List[PageDescriptor], Dict[str, List[PageDescriptor]]]:
     run_root = resolve_run_path(config.storage_root, run_id)
-    screenshot_root = run_root / config.screenshot_dir
-    dom_root = run_root / config.dom_dir
-    screenshot_root.mkdir(parents=True, exist_ok=True)
-    dom_root.mkdir(parents=True, exist_ok=True)
+    screenshot_root = ensure_dir(run_root / config.screenshot_dir)
+    dom_root = ensure_dir(run_root / config.dom_dir)
 
     base_url = payload.target_url.rstrip("/")
     parsed_base = urlparse(base_url)
-    allow_netloc = parsed_base.netloc
+    allow_host = _url_host(parsed_base)
+    base_origin = f"{parsed_base.scheme}://{allow_host}"
 
     descriptors: List[PageDescriptor] = []
     adjacency: Dict[str, List[PageDescriptor]] = {}
@@ -121,11 +143,19 @@ def _discover_with_playwright(
         assigned_ids.add(candidate)
         return candidate
 
-    def record_descriptor(url: str, title: str, page_id: str, dom: str, screenshot_bytes: bytes) -> PageDescriptor:
-        screenshot_path = (screenshot_root / f"{page_id}.png")
-        dom_path = (dom_root / f"{page_id}.html")
-        screenshot_path.write_bytes(screenshot_bytes)
-        dom_path.write_text(dom, encoding="utf-8")
+    def write_artifacts(page_id: str, dom: str, screenshot_bytes: bytes) -> None:
+        (screenshot_root / f"{page_id}.png").write_bytes(screenshot_bytes)
+        (dom_root / f"{page_id}.html").write_text(dom, encoding="utf-8")
+
+    def schedule_write(page_id: str, dom: str, screenshot_bytes: bytes) -> None:
+        loop = asyncio.get_running_loop()
+        pending_writes.append(
+            loop.run_in_executor(io_pool, write_artifacts, page_id, dom, screenshot_bytes)
+        )
+
+    def record_descriptor(url: str, title: str, page_id: str) -> PageDescriptor:
+        screenshot_path = screenshot_root / f"{page_id}.png"
+        dom_path = dom_root / f"{page_id}.html"
         descriptor = PageDescriptor(
             url=url,
             title=title or url,
@@ -138,89 +168,126 @@ def _discover_with_playwright(
         adjacency.setdefault(page_id, [])
         return descriptor
 
-    def extract_links(page) -> List[str]:  # type: ignore[no-untyped-def]
+    async def extract_links(page) -> List[str]:  # type: ignore[no-untyped-def]
+        # Canonicalization, host filtering and dedup run in the page so only
+        # same-host candidate URLs cross the browser bridge.
         selector_script = """
-        (selectors) => {
+        ([selectors, allowHost, baseOrigin]) => {
             const unique = new Set();
-            const urls = [];
             for (const selector of selectors) {
                 for (const el of document.querySelectorAll(selector)) {
                     if (!el || !el.href) continue;
-                    urls.push(el.href);
+                    let url;
+                    try {
+                        url = new URL(el.href, document.baseURI);
+                    } catch (err) {
+                        continue;
+                    }
+                    if (url.protocol !== "http:" && url.protocol !== "https:") continue;
+                    if (url.host !== allowHost) continue;
+                    unique.add(baseOrigin + (url.pathname || "/"));
                 }
             }
-            return urls;
+            return Array.from(unique);
         }
         """
         try:
-            results = page.eval_on_selector_all("body", selector_script, list(config.link_selectors))
+            results = await page.evaluate(
+                selector_script, [list(config.link_selectors), allow_host, base_origin]
+            )
         except Exception:
             results = []
         cleaned: List[str] = []
-        for href in results:
-            if not isinstance(href, str):
-                continue
-            href = href.strip()
-            if not href or href.startswith("javascript:"):
-                continue
-            parsed = urlparse(href)
-            if parsed.scheme not in {"http", "https"}:
-                continue
-            netloc = parsed.netloc or allow_netloc
-            if netloc != allow_netloc:
-                continue
-            normalized = urljoin(base_url + "/", parsed.path or "/")
-            if normalized in seen_urls:
+        for normalized in results:
+            if not isinstance(normalized, str) or normalized in seen_urls:
                 continue
             seen_urls.add(normalized)
             cleaned.append(normalized)
         return cleaned
 
+    async def navigate(page, url: str) -> None:  # type: ignore[no-untyped-def]
+        await page.goto(url, wait_until=config.wait_until, timeout=config.timeout_ms)
+        if config.wait_for and config.wait_for != config.wait_until:
+            await page.wait_for_load_state(config.wait_for, timeout=config.timeout_ms)
+
+    async def capture(link: str, page_id: str) -> str | None:
+        # Pages are checked out of a small pool and reused across links.
+        child_page = await page_pool.get()
+        try:
+            try:
+                await navigate(child_page, link)
+            except PlaywrightTimeoutError:
+                logger.warning("Timed out capturing %s", link)
+                return None
+            title = await child_page.title()
+            schedule_write(
+                page_id,
+                await child_page.content(),
+                await child_page.screenshot(full_page=True),
+            )
+            return title
+        finally:
+            page_pool.put_nowait(child_page)
+
+    page_pool: asyncio.Queue = asyncio.Queue()
+    # Artifact writes run on a small pool so disk latency overlaps navigation.
+    io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="discovery-io")
+    pending_writes: List[asyncio.Future[None]] = []
+
     try:
-        with _sync_playwright() as playwright:
+        async with _async_playwright() as playwright:
             browser_type = playwright.chromium
-            browser = browser_type.launch(headless=True)
-            context = browser.new_context()
-            page = context.new_page()
+            browser = await browser_type.launch(headless=True)
+            context = await browser.new_context()
+            page = await context.new_page()
             try:
-                page.goto(base_url, wait_until=config.wait_for, timeout=config.timeout_ms)
+                await navigate(page, base_url)
             except PlaywrightTimeoutError as exc:
                 raise SiteDiscoveryError(f"Timed out reaching {base_url}: {exc}") from exc
 
             root_id = derive_page_id(base_url)
-            dom = page.content()
-            screenshot_bytes = page.screenshot(full_page=True)
-            root_descriptor = record_descriptor(base_url, page.title(), root_id, dom, screenshot_bytes)
+            schedule_write(root_id, await page.content(), await page.screenshot(full_page=True))
+            record_descriptor(base_url, await page.title(), root_id)
 
             seen_urls.add(base_url)
+            seen_urls.add(base_origin + (parsed_base.path or "/"))
 
-            candidate_links = extract_links(page)
+            candidate_links = await extract_links(page)
             limit = max(0, config.max_pages - 1)
             candidate_links = candidate_links[:limit]
-
-            for link in candidate_links:
-                page_id = derive_page_id(link)
-                child_page = context.new_page()
-                try:
-                    child_page.goto(link, wait_until=config.wait_for, timeout=config.timeout_ms)
-                except PlaywrightTimeoutError:
-                    child_page.close()
-                    logger.warning("Timed out capturing %s", link)
+            # Page ids are assigned in link order before fanning out so they stay deterministic.
+            page_ids = [derive_page_id(link) for link in candidate_links]
+
+            page_pool.put_nowait(page)
+            for _ in range(min(max(1, config.concurrency), len(candidate_links)) - 1):
+                page_pool.put_nowait(await context.new_page())
+
+            captures = await asyncio.gather(
+                *(
+                    capture(link, page_id)
+                    for link, page_id in zip(candidate_links, page_ids)
+                ),
+                return_exceptions=True,
+            )
+            for link, page_id, title in zip(candidate_links, page_ids, captures):
+                if isinstance(title, BaseException):
+                    raise title
+                if title is None:
                     continue
-                dom = child_page.content()
-                screenshot_bytes = child_page.screenshot(full_page=True)
-                descriptor = record_descriptor(link, child_page.title(), page_id, dom, screenshot_bytes)
+                descriptor = record_descriptor(link, title, page_id)
                 adjacency[root_id].append(descriptor)
                 adjacency.setdefault(page_id, [])
-                child_page.close()
 
-            browser.close()
+            await browser.close()
+        await asyncio.gather(*pending_writes)
     except PlaywrightTimeoutError as exc:  # pragma: no cover - double guard
         raise SiteDiscoveryError(f"Site discovery timeout: {exc}") from exc
     except SiteDiscoveryError:
         raise
     except Exception as exc:
         raise SiteDiscoveryError(f"Site discovery failed: {exc}") from exc
+    finally:
+        io_pool.shutdown(wait=True)
 
     if not descriptors:
         raise SiteDiscoveryError("No pages discovered")
@@ -228,4 +295,16 @@ def _discover_with_playwright(
     return descriptors, adjacency
 
 
+def _url_host(parsed: ParseResult) -> str:
+    """Return the host the way JS ``URL.host`` spells it: no userinfo or default port."""
+
+    host = (parsed.hostname or "").lower()
+    if ":" in host:
+        host = f"[{host}]"
+    port = parsed.port
+    if port is None or _DEFAULT_PORTS.get(parsed.scheme) == port:
+        return host
+    return f"{host}:{port}"
+
+
 __all__ = ["discover_site_map", "DiscoveryConfig", "SiteDiscoveryError"]
@@ -1,19 +1,25 @@
 """Exploration scaffold for FR-003 with FR-016 guardrails."""
 from __future__ import annotations
 
-import json
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, Iterable, List, Sequence
 
+from .file_utils import atomic_write_bytes, atomic_writer
+from .json_utils import dumps, dumps_line
+from .keywords import KeywordMatcher
 from .telemetry import NoOpTelemetry, TelemetrySink
 from .path_utils import resolve_run_path
 
 
 logger = logging.getLogger(__name__)
 
+# Coverage ratios are handled in basis points so budgets and reported
+# percentages avoid float rounding drift (e.g. 100 * 0.29 == 28.999...).
+_COVERAGE_SCALE = 10_000
+
 
 @dataclass(slots=True)
 class PageDescriptor:
@@ -23,6 +29,17 @@ class PageDescriptor:
     page_id: str | None = None
     screenshot: str | None = None
     dom_snapshot: str | None = None
+    url_lower: str = field(init=False, repr=False, compare=False)
+    title_lower: str = field(init=False, repr=False, compare=False)
+    key: str = field(init=False, repr=False, compare=False)
+    _artifact_line: bytes | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Lowercased forms are computed once at construction for keyword and dedupe checks.
+        self.url_lower = (self.url or "").lower()
+        self.title_lower = (self.title or "").lower()
+        # Adjacency maps are keyed by page id, falling back to the URL.
+        self.key = self.page_id or self.url
 
     def to_artifact(self) -> Dict[str, str | None]:
         return {
@@ -34,6 +51,51 @@ class PageDescriptor:
             "dom_snapshot": self.dom_snapshot,
         }
 
+    def artifact_line(self) -> bytes:
+        """Return :meth:`to_artifact` as a JSONL record, encoded once and reused."""
+
+        line = self._artifact_line
+        if line is None:
+            line = self._artifact_line = dumps_line(self.to_artifact())
+        return line
+
+
+@dataclass(slots=True)
+class GuardrailEvent:
+    """Guardrail hit recorded to a phase's guardrail log."""
+
+    run_id: str
+    phase: str
+    type: str
+    url: str
+    title: str
+    timestamp: str
+    depth: int | None = None
+    source_page_id: str | None = None
+    source_url: str | None = None
+    keyword: str | None = None
+    limit: int | None = None
+
+    def to_artifact(self) -> Dict[str, object]:
+        artifact: Dict[str, object] = {
+            "run_id": self.run_id,
+            "phase": self.phase,
+            "type": self.type,
+            "url": self.url,
+            "title": self.title,
+        }
+        if self.depth is not None:
+            artifact["depth"] = self.depth
+        artifact["timestamp"] = self.timestamp
+        if self.source_url is not None:
+            artifact["source_page_id"] = self.source_page_id
+            artifact["source_url"] = self.source_url
+        if self.keyword:
+            artifact["keyword"] = self.keyword
+        if self.limit is not None:
+            artifact["limit"] = self.limit
+        return artifact
+
 
 @dataclass(slots=True)
 class ExplorationConfig:
@@ -79,81 +141,101 @@ class ExplorationEngine:
     ) -> None:
         self.config = config or ExplorationConfig()
         self.telemetry = telemetry or NoOpTelemetry()
+        self._destructive_keywords = KeywordMatcher(self.config.destructive_keywords)
+
+    def explore(
+        self,
+        run_id: str,
+        site_map: Iterable[PageDescriptor],
+        *,
+        run_dir: Path | None = None,
+    ) -> ExplorationResult:
+        """Explore ``site_map``; pass ``run_dir`` when the caller already resolved it."""
 
-    def explore(self, run_id: str, site_map: Iterable[PageDescriptor]) -> ExplorationResult:
         pages = list(site_map)
         if not pages:
             raise ValueError("site_map must contain at least one page")
-        budget = max(1, int(len(pages) * self.config.coverage_threshold))
+        total = len(pages)
+        # One timestamp covers the whole pass, including its guardrail events.
+        timestamp = datetime.now(timezone.utc).isoformat()
+        threshold_bp = round(self.config.coverage_threshold * _COVERAGE_SCALE)
+        budget = max(1, total * threshold_bp // _COVERAGE_SCALE)
         candidate_pages = pages[:budget]
         baseline_skipped = pages[budget:]
 
         visited: List[PageDescriptor] = []
         skipped: List[PageDescriptor] = []
-        guardrail_events: List[Dict[str, object]] = []
-        rate_limited = False
+        guardrail_events: List[GuardrailEvent] = []
+        limit = self.config.max_pages_per_run
+        # With the no-op sink no guardrail payload is built or queued.
+        telemetry_on = not isinstance(self.telemetry, NoOpTelemetry)
 
         for idx, page in enumerate(candidate_pages):
-            keyword = self._match_keyword(page)
+            keyword = self._destructive_keywords.first_match(page.url_lower, page.title_lower)
             if keyword:
                 guardrail_events.append(
-                    self._guardrail_event(run_id, "blocklist", page, keyword=keyword)
+                    self._guardrail_event(
+                        run_id, "blocklist", page, timestamp, keyword=keyword
+                    )
                 )
                 skipped.append(page)
-                self._emit(
-                    "guardrail.blocklist",
-                    {
-                        "run_id": run_id,
-                        "phase": "exploration",
-                        "url": page.url,
-                        "keyword": keyword,
-                    },
-                )
+                if telemetry_on:
+                    self._emit(
+                        "guardrail.blocklist",
+                        {
+                            "run_id": run_id,
+                            "phase": "exploration",
+                            "url": page.url,
+                            "keyword": keyword,
+                        },
+                    )
                 continue
-            if self._rate_limited(len(visited)):
-                guardrail_events.append(self._guardrail_event(run_id, "rate_limit", page))
+            if limit > 0 and len(visited) >= limit:
+                guardrail_events.append(self._guardrail_event(run_id, "rate_limit", page, timestamp))
                 skipped.append(page)
                 skipped.extend(candidate_pages[idx + 1 :])
-                rate_limited = True
-                self._emit(
-                    "guardrail.rate_limit",
-                    {
-                        "run_id": run_id,
-                        "phase": "exploration",
-                        "url": page.url,
-                        "limit": self.config.max_pages_per_run,
-                    },
-                )
+                if telemetry_on:
+                    self._emit(
+                        "guardrail.rate_limit",
+                        {
+                            "run_id": run_id,
+                            "phase": "exploration",
+                            "url": page.url,
+                            "limit": limit,
+                        },
+                    )
                 break
             visited.append(page)
 
-        if not rate_limited:
-            skipped.extend(page for page in candidate_pages if page not in visited and page not in skipped)
+        # Every candidate is now either visited or skipped, so only the pages
+        # beyond the coverage budget remain to be recorded.
         skipped.extend(baseline_skipped)
 
-        coverage = len(visited) / len(pages)
-        timestamp = datetime.now(timezone.utc).isoformat()
+        # Round half up to four decimal places using integer arithmetic.
+        coverage_bp = (len(visited) * 2 * _COVERAGE_SCALE + total) // (2 * total)
         result = ExplorationResult(
             run_id=run_id,
-            coverage_percent=round(coverage, 4),
+            coverage_percent=coverage_bp / _COVERAGE_SCALE,
             visited_pages=visited,
             skipped_pages=skipped,
             timestamp=timestamp,
         )
-        self._persist(run_id, result, guardrail_events)
+        self._persist(run_id, result, guardrail_events, run_dir)
         return result
 
     def _persist(
         self,
         run_id: str,
         result: ExplorationResult,
-        guardrail_events: List[Dict[str, object]],
+        guardrail_events: List[GuardrailEvent],
+        run_dir: Path | None = None,
     ) -> None:
-        run_dir = resolve_run_path(self.config.storage_root, run_id) / "exploration"
-        run_dir.mkdir(parents=True, exist_ok=True)
-        coverage_path = run_dir / "coverage_report.json"
-        coverage_path.write_text(
-            json.dumps(
+        if run_dir is None:
+            run_dir = resolve_run_path(self.config.storage_root, run_id)
+        run_dir = run_dir / "exploration"
+        atomic_write_bytes(
+            run_dir / "coverage_report.json",
+            dumps(
                 {
                     "run_id": result.run_id,
                     "coverage_percent": result.coverage_percent,
@@ -161,66 +243,38 @@ class ExplorationEngine:
                     "total_pages": len(result.visited_pages) + len(result.skipped_pages),
                     "generated_at": result.timestamp,
                 },
-                indent=2,
+                indent=True,
             ),
-            encoding="utf-8",
-        )
-        pages_path = run_dir / "visited_pages.jsonl"
-        pages_path.write_text(
-            "".join(
-                json.dumps(page.to_artifact()) + "\n" for page in result.visited_pages
-            ),
-            encoding="utf-8",
-        )
-        skipped_path = run_dir / "skipped_pages.jsonl"
-        skipped_path.write_text(
-            "".join(
-                json.dumps(page.to_artifact()) + "\n" for page in result.skipped_pages
-            ),
-            encoding="utf-8",
         )
+        # JSONL bodies stream through the buffered writer instead of being
+        # joined into one bytes object first.
+        with atomic_writer(run_dir / "visited_pages.jsonl") as handle:
+            handle.writelines(page.artifact_line() for page in result.visited_pages)
+        with atomic_writer(run_dir / "skipped_pages.jsonl") as handle:
+            handle.writelines(page.artifact_line() for page in result.skipped_pages)
         if guardrail_events:
-            guardrail_path = run_dir / self.config.guardrail_log_name
-            guardrail_path.write_text(
-                "".join(json.dumps(event) + "\n" for event in guardrail_events),
-                encoding="utf-8",
-            )
-
-    def _match_keyword(self, page: PageDescriptor) -> str | None:
-        keywords = [kw.lower() for kw in self.config.destructive_keywords]
-        haystack = f"{page.url} {page.title}".lower()
-        for keyword in keywords:
-            if keyword and keyword in haystack:
-                return keyword
-        return None
-
-    def _rate_limited(self, processed_count: int) -> bool:
-        limit = self.config.max_pages_per_run
-        if limit <= 0:
-            return False
-        return processed_count >= limit
+            with atomic_writer(run_dir / self.config.guardrail_log_name) as handle:
+                handle.writelines(dumps_line(event.to_artifact()) for event in guardrail_events)
 
     def _guardrail_event(
         self,
         run_id: str,
         event_type: str,
         page: PageDescriptor,
+        timestamp: str,
         *,
         keyword: str | None = None,
-    ) -> Dict[str, object]:
-        payload: Dict[str, object] = {
-            "run_id": run_id,
-            "phase": "exploration",
-            "type": event_type,
-            "url": page.url,
-            "title": page.title,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-        }
-        if keyword:
-            payload["keyword"] = keyword
-        if event_type == "rate_limit":
-            payload["limit"] = self.config.max_pages_per_run
-        return payload
+    ) -> GuardrailEvent:
+        return GuardrailEvent(
+            run_id=run_id,
+            phase="exploration",
+            type=event_type,
+            url=page.url,
+            title=page.title,
+            timestamp=timestamp,
+            keyword=keyword,
+            limit=self.config.max_pages_per_run if event_type == "rate_limit" else None,
+        )
 
     def _emit(self, event: str, payload: Dict[str, object]) -> None:
         try:
@@ -233,5 +287,6 @@ __all__ = [
     "ExplorationEngine",
     "ExplorationConfig",
     "ExplorationResult",
+    "GuardrailEvent",
     "PageDescriptor",
 ]
@@ -0,0 +1,192 @@
+"""Filesystem helpers for writing run artifacts."""
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO, Iterator
+
+
+_ENSURED_DIRS: set[str] = set()
+_ENSURED_DIRS_MAX = 4096
+
+_WRITE_FLAGS = (
+    os.O_WRONLY
+    | os.O_CREAT
+    | os.O_TRUNC
+    | getattr(os, "O_BINARY", 0)
+    | getattr(os, "O_CLOEXEC", 0)
+)
+
+# fdatasync skips flushing metadata such as mtime that a rename does not need.
+_datasync = getattr(os, "fdatasync", os.fsync)
+
+
+def atomic_write_bytes(path: Path | str, data: bytes, *, durable: bool = False) -> None:
+    """Write ``data`` to ``path`` via a temporary sibling and ``os.replace``.
+
+    Parent directories are created only when the first write attempt reports
+    that they are missing. With ``durable`` the file's data is synced
+    (``fdatasync`` where available) before the rename and the parent
+    directory is fsynced after it.
+    """
+
+    target = os.fspath(path)
+    tmp = _temp_path(target)
+    try:
+        fd = os.open(tmp, _WRITE_FLAGS, 0o666)
+    except FileNotFoundError:
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        fd = os.open(tmp, _WRITE_FLAGS, 0o666)
+    try:
+        try:
+            _write_all(fd, data)
+            if durable:
+                _datasync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp, target)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+    if durable:
+        fsync_directory(os.path.dirname(target))
+
+
+def _temp_path(target: str) -> str:
+    # Unique per process and thread, so concurrent writers of one target never
+    # share (and race on renaming) a temporary file; a thread writes one at a time.
+    return f"{target}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view) :]
+
+
+def fsync_directory(path: Path | str) -> None:
+    """Flush directory entry changes under ``path`` where the platform allows it."""
+
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:  # pragma: no cover - directories cannot be opened on Windows
+        return
+    try:
+        os.fsync(fd)
+    except OSError:  # pragma: no cover - filesystem without directory fsync
+        pass
+    finally:
+        os.close(fd)
+
+
+def ensure_dir(path: Path) -> Path:
+    """Create ``path`` (and parents) once per process and return it."""
+
+    key = os.fspath(path)
+    if key not in _ENSURED_DIRS:
+        path.mkdir(parents=True, exist_ok=True)
+        if len(_ENSURED_DIRS) >= _ENSURED_DIRS_MAX:
+            _ENSURED_DIRS.clear()
+        _ENSURED_DIRS.add(key)
+    return path
+
+
+@contextmanager
+def atomic_writer(path: Path, *, buffering: int = 1 << 20) -> Iterator[BinaryIO]:
+    """Yield a buffered binary handle whose contents replace ``path`` on success."""
+
+    tmp = Path(_temp_path(os.fspath(path)))
+    try:
+        handle = tmp.open("wb", buffering=buffering)
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        handle = tmp.open("wb", buffering=buffering)
+    try:
+        with handle:
+            yield handle
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+class AppendHandlePool:
+    """Keep a bounded LRU set of append handles keyed by path.
+
+    Handles are unbuffered by default. With ``buffer_size`` appends collect in
+    memory until the buffer fills, :meth:`flush` is called, or the handle is
+    evicted or closed.
+    """
+
+    def __init__(self, max_handles: int = 64, buffer_size: int = 0) -> None:
+        self.max_handles = max(1, max_handles)
+        self.buffer_size = max(0, buffer_size)
+        self._handles: OrderedDict[str, BinaryIO] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def append(self, path: Path | str, data: bytes) -> None:
+        """Append ``data`` to ``path``, creating parent directories on first use."""
+
+        key = os.fspath(path)
+        with self._lock:
+            handle = self._handles.get(key)
+            if handle is None:
+                try:
+                    handle = open(key, "ab", buffering=self.buffer_size)
+                except FileNotFoundError:
+                    os.makedirs(os.path.dirname(key), exist_ok=True)
+                    handle = open(key, "ab", buffering=self.buffer_size)
+                self._handles[key] = handle
+                if len(self._handles) > self.max_handles:
+                    _, evicted = self._handles.popitem(last=False)
+                    evicted.close()
+            else:
+                self._handles.move_to_end(key)
+            handle.write(data)
+
+    def flush(self, *paths: Path | str) -> None:
+        """Flush the handles for ``paths``, or every pooled handle when none are given."""
+
+        with self._lock:
+            if not paths:
+                handles = list(self._handles.values())
+            else:
+                handles = [
+                    handle
+                    for handle in map(self._handles.get, map(os.fspath, paths))
+                    if handle is not None
+                ]
+            for handle in handles:
+                handle.flush()
+
+    def sync(self, path: Path | str) -> None:
+        """Flush the handle for ``path`` and fsync it, if the pool holds one."""
+
+        with self._lock:
+            handle = self._handles.get(os.fspath(path))
+            if handle is not None:
+                handle.flush()
+                os.fsync(handle.fileno())
+
+    def close(self) -> None:
+        """Close every pooled handle."""
+
+        with self._lock:
+            for handle in self._handles.values():
+                handle.close()
+            self._handles.clear()
+
+
+__all__ = [
+    "AppendHandlePool",
+    "atomic_write_bytes",
+    "atomic_writer",
+    "ensure_dir",
+    "fsync_directory",
+]
@@ -0,0 +1,64 @@
+"""JSON encoding helpers that use orjson when it is installed."""
+from __future__ import annotations
+
+import json
+from typing import Any, Dict
+
+try:  # pragma: no cover - optional accelerator
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    _orjson = None
+
+
+def dumps(obj: Any, *, indent: bool = False) -> bytes:
+    """Serialize ``obj`` to UTF-8 encoded JSON bytes."""
+
+    if _orjson is not None:
+        option = _orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= _orjson.OPT_INDENT_2
+        return _orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
+
+def dumps_line(obj: Any, *, sort_keys: bool = False) -> bytes:
+    """Serialize ``obj`` as a single newline-terminated JSONL record."""
+
+    if _orjson is not None:
+        option = _orjson.OPT_NON_STR_KEYS | _orjson.OPT_APPEND_NEWLINE
+        if sort_keys:
+            option |= _orjson.OPT_SORT_KEYS
+        return _orjson.dumps(obj, option=option)
+    return json.dumps(obj, ensure_ascii=False, sort_keys=sort_keys).encode("utf-8") + b"\n"
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse JSON from bytes or text."""
+
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
+_JSON_SCALAR_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
+def safe_metadata(metadata: Dict[str, Any], *, copy: bool = False) -> Dict[str, Any]:
+    """Return ``metadata`` with non-scalar values converted to strings.
+
+    An all-scalar mapping is returned as is, or as a shallow copy with ``copy``.
+    """
+
+    # Exact type lookups clear the common all-scalar case; subclasses such as enums take the slow path.
+    if all(type(value) in _JSON_SCALAR_TYPES for value in metadata.values()):
+        return dict(metadata) if copy else metadata
+    safe: Dict[str, Any] = {}
+    for key, value in metadata.items():
+        if isinstance(value, (str, int, float, bool)) or value is None:
+            safe[key] = value
+        else:
+            safe[key] = str(value)
+    return safe
+
+
+__all__ = ["dumps", "dumps_line", "loads", "safe_metadata"]
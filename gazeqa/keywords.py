@@ -0,0 +1,50 @@
+"""Keyword matching shared by the exploration and crawl guardrails."""
+from __future__ import annotations
+
+import re
+from typing import Iterable
+
+
+def keyword_pattern(keywords: Iterable[str]) -> re.Pattern[str] | None:
+    """Compile keywords into a single lowercase alternation, or ``None`` when empty."""
+
+    lowered = [keyword.lower() for keyword in keywords if keyword]
+    if not lowered:
+        return None
+    return re.compile("|".join(map(re.escape, lowered)))
+
+
+class KeywordMatcher:
+    """Matches already-lowercased text against a fixed set of keywords."""
+
+    __slots__ = ("keywords", "_pattern")
+
+    def __init__(self, keywords: Iterable[str]) -> None:
+        self.keywords = tuple(keyword.lower() for keyword in keywords if keyword)
+        self._pattern = keyword_pattern(self.keywords)
+
+    def matches(self, text: str) -> bool:
+        """Return True when any keyword occurs in ``text``."""
+
+        return self._pattern is not None and self._pattern.search(text) is not None
+
+    def first_match(self, *texts: str) -> str | None:
+        """Return the first configured keyword found in any of ``texts``."""
+
+        # The compiled alternation rejects clean text in one scan; on a hit the
+        # keyword tuple reports the first configured keyword.
+        pattern = self._pattern
+        if pattern is None:
+            return None
+        for text in texts:
+            if pattern.search(text):
+                break
+        else:
+            return None
+        for keyword in self.keywords:
+            if any(keyword in text for text in texts):
+                return keyword
+        return None
+
+
+__all__ = ["KeywordMatcher", "keyword_pattern"]
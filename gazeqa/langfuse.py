@@ -1,15 +1,22 @@
 """Langfuse telemetry client for FR-011."""
 from __future__ import annotations
 
+import http.client
 import logging
 import os
+import threading
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
 
-import requests
+from .json_utils import dumps
 
 logger = logging.getLogger(__name__)
 
+# The most recent from_env() client, keyed by its class and settings.
+_ENV_CLIENT: Dict[tuple, "LangfuseClient"] = {}
+_ENV_CLIENT_LOCK = threading.Lock()
+
 
 class LangfuseClient:
     """Minimal client for forwarding spans to Langfuse."""
@@ -28,10 +35,31 @@ class LangfuseClient:
         self.secret_key = secret_key
         self.environment = environment
         self.timeout_seconds = timeout_seconds
+        parsed = urlsplit(self.base_url)
+        self._connection_class = (
+            http.client.HTTPSConnection if parsed.scheme == "https" else http.client.HTTPConnection
+        )
+        self._host = parsed.hostname or ""
+        self._port = parsed.port
+        self._ingest_path = f"{parsed.path}/api/public/ingest"
+        self._headers = {
+            "Authorization": f"Bearer {secret_key}",
+            "X-Langfuse-Public-Key": public_key,
+            "Content-Type": "application/json",
+            "Connection": "keep-alive",
+        }
+        self._connection: Optional[http.client.HTTPConnection] = None
+        self._connection_lock = threading.Lock()
 
     # -------------------------------------------------------------- construction
     @classmethod
     def from_env(cls) -> Optional[LangfuseClient]:
+        """Return the client configured by the ``LANGFUSE_*`` environment variables.
+
+        Callers share one client (and its keep-alive connection) while the
+        variables are unchanged; changed values or a subclass get a new one.
+        """
+
         secret = os.getenv("LANGFUSE_SECRET_KEY")
         public = os.getenv("LANGFUSE_PUBLIC_KEY")
         if not secret or not public:
@@ -39,31 +67,78 @@ class LangfuseClient:
         base_url = os.getenv("LANGFUSE_BASE_URL", "https://cloud.langfuse.com")
         environment = os.getenv("LANGFUSE_ENVIRONMENT", "development")
         timeout = float(os.getenv("LANGFUSE_TIMEOUT_SECONDS", "5"))
-        return cls(base_url, public, secret, environment=environment, timeout_seconds=timeout)
+        key = (cls, base_url, public, secret, environment, timeout)
+        with _ENV_CLIENT_LOCK:
+            cached = _ENV_CLIENT.get(key)
+            if cached is None:
+                _ENV_CLIENT.clear()
+                cached = _ENV_CLIENT[key] = cls(
+                    base_url, public, secret, environment=environment, timeout_seconds=timeout
+                )
+        return cached
 
     # -------------------------------------------------------------------- public
     def emit(self, event: str, payload: Dict[str, Any]) -> None:
         """Send a telemetry event as a Langfuse span."""
 
-        trace_id = _extract_trace_id(payload)
-        body = {
-            "traceId": trace_id,
+        self._post(self._span(event, payload), event)
+
+    # ------------------------------------------------------------------ helpers
+    def _span(self, event: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "traceId": _extract_trace_id(payload),
             "name": event,
             "timestamp": payload.get("timestamp") or datetime.now(timezone.utc).isoformat(),
             "environment": self.environment,
             "metadata": payload,
         }
-        url = f"{self.base_url}/api/public/ingest"
-        headers = {
-            "Authorization": f"Bearer {self.secret_key}",
-            "X-Langfuse-Public-Key": self.public_key,
-            "Content-Type": "application/json",
-        }
+
+    def close(self) -> None:
+        """Close the keep-alive connection; the next emit reconnects."""
+
+        with self._connection_lock:
+            self._drop_connection()
+
+    def _post(self, body: Dict[str, Any], label: str) -> None:
         try:
-            response = requests.post(url, json=body, headers=headers, timeout=self.timeout_seconds)
-            response.raise_for_status()
-        except requests.RequestException as exc:  # pragma: no cover - best effort logging
-            logger.warning("Failed to emit Langfuse span for %s: %s", event, exc)
+            status = self._send(dumps(body))
+        except (OSError, http.client.HTTPException) as exc:  # pragma: no cover - best effort logging
+            logger.warning("Failed to emit Langfuse span for %s: %s", label, exc)
+            return
+        if status >= 400:  # pragma: no cover - best effort logging
+            logger.warning("Failed to emit Langfuse span for %s: HTTP %s", label, status)
+
+    def _send(self, data: bytes) -> int:
+        # One persistent connection per client; a connection the server closed
+        # while idle is replaced and the request retried once.
+        with self._connection_lock:
+            for attempt in range(2):
+                connection = self._connection
+                if connection is None:
+                    connection = self._connection = self._connection_class(
+                        self._host, self._port, timeout=self.timeout_seconds
+                    )
+                try:
+                    connection.request("POST", self._ingest_path, body=data, headers=self._headers)
+                    response = connection.getresponse()
+                    response.read()
+                except (ConnectionResetError, BrokenPipeError, http.client.BadStatusLine):
+                    self._drop_connection()
+                    if attempt:
+                        raise
+                    continue
+                except BaseException:
+                    self._drop_connection()
+                    raise
+                if response.will_close:
+                    self._drop_connection()
+                return response.status
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    def _drop_connection(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
 
 
 def _extract_trace_id(payload: Dict[str, Any]) -> str:
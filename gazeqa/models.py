@@ -1,7 +1,9 @@
 """Core data models for GazeQA run intake."""
 from __future__ import annotations
 
+import functools
 import re
+import sys
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 from urllib.parse import urlparse
@@ -110,19 +112,25 @@ class CreateRunPayload:
         if errors:
             raise ValidationError(errors)
 
+        # Organization, slug, role and profile repeat across runs; interning lets
+        # the many dicts keyed or compared on them share one string object.
         return cls(
             target_url=target_url,
             credentials=credentials,
             budgets=budgets,
-            storage_profile=storage_profile,
+            storage_profile=sys.intern(storage_profile),
             tags=tags,
-            organization=organization,
-            organization_slug=organization_slug,
-            actor_role=actor_role,
+            organization=sys.intern(organization),
+            organization_slug=sys.intern(organization_slug),
+            actor_role=sys.intern(actor_role),
         )
 
 
+@functools.lru_cache(maxsize=2048)
 def _is_valid_url(value: str) -> bool:
+    # A scheme plus a netloc always needs "://"; anything else fails without parsing.
+    if "://" not in value:
+        return False
     parsed = urlparse(value)
     return bool(parsed.scheme and parsed.netloc)
 
@@ -136,18 +144,29 @@ def _coerce_int(value: object, default: int) -> int:
         return default
 
 
-_SLUG_PATTERN = re.compile(r"^[a-z0-9]+(?:-[a-z0-9]+)*$")
+_DASH = ord("-")
+
+
+class _SlugTable(dict):
+    """Translation table keeping ``[a-z0-9-]`` and mapping everything else to ``-``."""
+
+    def __missing__(self, codepoint: int) -> int:
+        return _DASH
+
+
+_SLUG_TABLE = _SlugTable({ord(ch): ord(ch) for ch in "abcdefghijklmnopqrstuvwxyz0123456789-"})
+_DASH_RUN = re.compile(r"-{2,}")
 
 
 def _normalize_slug(value: str) -> str:
     slug = value.strip().lower()
     if not slug:
         return "default"
-    slug = slug.replace("_", "-")
-    slug = re.sub(r"[^a-z0-9-]", "-", slug)
-    slug = re.sub(r"-+", "-", slug).strip("-")
+    if slug.isascii() and slug.isalnum():
+        return slug
+    # The table leaves only [a-z0-9-], so collapsing and trimming dashes yields
+    # a valid slug without a separate validation pass.
+    slug = _DASH_RUN.sub("-", slug.translate(_SLUG_TABLE)).strip("-")
     if not slug:
         raise ValueError("organization_slug must contain alphanumeric characters")
-    if not _SLUG_PATTERN.match(slug):
-        raise ValueError("organization_slug may contain lowercase letters, numbers, and hyphens")
     return slug
@@ -1,19 +1,34 @@
 """Structured observability sink for workflow telemetry (FR-011)."""
 from __future__ import annotations
 
-import json
 import logging
+import os
+import sys
+import threading
+import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 
-from .telemetry import TelemetrySink
+from .file_utils import AppendHandlePool, atomic_write_bytes
+from .json_utils import dumps, dumps_line, loads
+from .telemetry import TelemetryBatcher, TelemetrySink, flush_at_exit
 from .path_utils import resolve_run_path
 from .langfuse import LangfuseClient
 
 
+try:  # pragma: no cover - optional binary metrics encoder
+    import cbor2 as _cbor2
+except ImportError:  # pragma: no cover - JSON-only environments
+    _cbor2 = None
+
 logger = logging.getLogger(__name__)
 
+_METRICS_FLUSH_INTERVAL = 0.25
+_TERMINAL_EVENTS = frozenset({"workflow.completed", "workflow.failed"})
+_LANGFUSE_QUEUE_SIZE = 1024
+_METADATA_MISS_LIMIT = 4096
+
 
 class RunObservability(TelemetrySink):
     """Aggregates telemetry into JSONL logs and metrics summaries."""
@@ -23,23 +38,77 @@ class RunObservability(TelemetrySink):
         storage_root: Path | str = "artifacts/runs",
         *,
         langfuse_client: Optional[LangfuseClient] = None,
+        metrics_format: Optional[str] = None,
+        langfuse_async: bool = True,
     ) -> None:
         self.storage_root = Path(storage_root)
+        self._metrics_format = _resolve_metrics_format(metrics_format)
         self._metrics_cache: Dict[str, Dict[str, Any]] = {}
         self._langfuse = langfuse_client
         self._metadata_cache: dict[str, Dict[str, Any]] = {}
-        self._run_index_mtime: Optional[float] = None
+        self._run_index_mtime: Optional[int] = None
+        self._metadata_misses: set[str] = set()
+        self._log_handles = AppendHandlePool()
+        self._dirty_metrics: set[str] = set()
+        self._metrics_flushed_at: Dict[str, float] = {}
+        self._metrics_lock = threading.Lock()
+        self._metrics_timers: Dict[str, threading.Timer] = {}
+        self._metrics_stubs: set[str] = set()
+        # Langfuse events go through a background worker unless the caller
+        # already emits from one (langfuse_async=False).
+        self._langfuse_batcher: Optional[TelemetryBatcher] = None
+        if langfuse_client is not None and langfuse_async:
+            self._langfuse_batcher = TelemetryBatcher(
+                langfuse_client,
+                name="observability-langfuse",
+                max_queue=_LANGFUSE_QUEUE_SIZE,
+                batch_window=0,
+            )
+        flush_at_exit(self)
 
     # ------------------------------------------------------------------ public
     def emit(self, event: str, payload: Dict[str, object]) -> None:
+        entry = self._record(event, payload)
+        if entry is not None:
+            self._forward_to_langfuse(event, entry)
+
+    def flush(self) -> None:
+        """Write pending metrics and wait for queued Langfuse events to be sent."""
+
+        for run_id in list(self._dirty_metrics):
+            metrics = self._metrics_cache.get(run_id)
+            if metrics is not None:
+                self._write_metrics(run_id, metrics)
+        if self._langfuse_batcher is not None:
+            self._langfuse_batcher.join()
+
+    def close(self) -> None:
+        """Flush pending work, stop the Langfuse worker and close log handles."""
+
+        self.flush()
+        with self._metrics_lock:
+            timers = list(self._metrics_timers.values())
+            self._metrics_timers.clear()
+        for timer in timers:
+            timer.cancel()
+        if self._langfuse_batcher is not None:
+            self._langfuse_batcher.close()
+            self._langfuse_batcher = None
+        self._log_handles.close()
+
+    # ---------------------------------------------------------------- internal
+    def _record(self, event: str, payload: Dict[str, object]) -> Optional[Dict[str, object]]:
+        """Log ``event`` and fold it into the run's metrics; returns the logged entry."""
+
         run_id = self._extract_run_id(payload)
         if not run_id:
             logger.debug("Telemetry event %s missing run_id; dropping", event)
-            return
+            return None
 
         entry = dict(payload)
         entry.setdefault("run_id", run_id)
-        entry.setdefault("timestamp", datetime.now(timezone.utc).isoformat())
+        if "timestamp" not in entry:
+            entry["timestamp"] = datetime.now(timezone.utc).isoformat()
         entry["event"] = event
         metadata = self._get_run_metadata(run_id)
         if metadata:
@@ -48,65 +117,75 @@ class RunObservability(TelemetrySink):
             entry.setdefault("actor_role", metadata.get("actor_role"))
         self._append_log(run_id, entry)
 
-        metrics = self._metrics_cache.setdefault(run_id, {"run_id": run_id})
+        metrics = self._metrics_cache.get(run_id)
+        if metrics is None:
+            metrics = self._metrics_cache[run_id] = {"run_id": run_id}
         if metadata:
             metrics.setdefault("organization_slug", metadata.get("organization_slug"))
             metrics.setdefault("organization", metadata.get("organization"))
-        self._update_metrics(metrics, entry)
-        self._persist_metrics(run_id, metrics)
-        self._forward_to_langfuse(event, entry)
+        with self._metrics_lock:
+            self._update_metrics(metrics, entry)
+        self._persist_metrics(run_id, metrics, force=event in _TERMINAL_EVENTS)
+        return entry
 
-    # ---------------------------------------------------------------- internal
     def _append_log(self, run_id: str, entry: Dict[str, object]) -> None:
-        logs_path = self._logs_path(run_id)
-        logs_path.parent.mkdir(parents=True, exist_ok=True)
-        with logs_path.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(entry) + "\n")
+        self._log_handles.append(self._logs_path(run_id), dumps_line(entry))
 
     def _update_metrics(self, metrics: Dict[str, Any], entry: Dict[str, object]) -> None:
         event = entry.get("event", "")
-        if event in {"auth.completed", "auth.skipped"}:
-            stage = entry.get("stage")
-            if not stage and event == "auth.skipped":
-                stage = "skipped"
-            metrics["auth"] = {
-                "stage": stage,
-                "success": bool(entry.get("success", True)),
-            }
-        elif event == "exploration.completed":
-            metrics["exploration"] = {
-                "coverage_percent": entry.get("coverage_percent"),
-                "visited_count": entry.get("visited_count"),
-                "skipped_count": entry.get("skipped_count"),
-            }
-        elif event == "crawl.completed":
-            visited = _to_int(entry.get("visited_count"))
-            skipped = _to_int(entry.get("skipped_count"))
-            summary: Dict[str, Any] = {
-                "visited_count": visited,
-                "skipped_count": skipped,
-            }
-            total = (visited or 0) + (skipped or 0)
-            if total:
-                summary["health_ratio"] = round((visited or 0) / total, 4)
-            metrics["crawl"] = summary
-        elif event.startswith("guardrail."):
+        handler = _METRIC_HANDLERS.get(event)
+        if handler is not None:
+            handler(metrics, entry)
+        elif event[:10] == "guardrail.":
             guardrails = metrics.setdefault("guardrails", {})
-            phase = str(entry.get("phase", "unknown"))
-            kind = event.split(".", 1)[1]
+            phase = sys.intern(str(entry.get("phase", "unknown")))
+            kind = sys.intern(event[10:])
             phase_counts = guardrails.setdefault(phase, {})
             phase_counts[kind] = int(phase_counts.get(kind, 0)) + 1
-        elif event == "workflow.completed":
-            metrics.setdefault("workflow", {})["completed_at"] = entry.get("timestamp")
-            metrics["workflow"]["status"] = "Completed"
-        elif event == "workflow.failed":
-            metrics.setdefault("workflow", {})["status"] = "Failed"
-            metrics["workflow"]["phase"] = entry.get("phase")
-            metrics["workflow"]["error"] = entry.get("error")
-
-    def _persist_metrics(self, run_id: str, metrics: Dict[str, Any]) -> None:
-        metrics_path = self._logs_path(run_id).parent / "metrics.json"
-        metrics_path.write_text(json.dumps(metrics, indent=2), encoding="utf-8")
+
+    def _persist_metrics(self, run_id: str, metrics: Dict[str, Any], *, force: bool = False) -> None:
+        # Bursts within the flush interval only mark the run dirty and arm a
+        # timer that writes it once the interval has passed.
+        last = self._metrics_flushed_at.get(run_id)
+        if not force and last is not None:
+            remaining = _METRICS_FLUSH_INTERVAL - (time.monotonic() - last)
+            if remaining > 0:
+                with self._metrics_lock:
+                    self._dirty_metrics.add(run_id)
+                    if run_id not in self._metrics_timers:
+                        timer = threading.Timer(remaining, self._write_dirty_metrics, args=(run_id,))
+                        timer.daemon = True
+                        self._metrics_timers[run_id] = timer
+                        timer.start()
+                return
+        self._write_metrics(run_id, metrics)
+
+    def _write_dirty_metrics(self, run_id: str) -> None:
+        with self._metrics_lock:
+            self._metrics_timers.pop(run_id, None)
+            if run_id not in self._dirty_metrics:
+                return
+        metrics = self._metrics_cache.get(run_id)
+        if metrics is not None:
+            try:
+                self._write_metrics(run_id, metrics)
+            except Exception:  # pragma: no cover - best effort from the timer thread
+                logger.warning("Failed to write metrics for %s", run_id, exc_info=True)
+
+    def _write_metrics(self, run_id: str, metrics: Dict[str, Any]) -> None:
+        obs_dir = self._logs_path(run_id).parent
+        with self._metrics_lock:
+            self._dirty_metrics.discard(run_id)
+            if self._metrics_format == "cbor":
+                atomic_write_bytes(obs_dir / "metrics.cbor", _cbor2.dumps(metrics, canonical=True))
+                if run_id not in self._metrics_stubs:
+                    # Readers of metrics.json find a pointer instead of stale data.
+                    stub = {"run_id": run_id, "format": "cbor", "path": "metrics.cbor"}
+                    atomic_write_bytes(obs_dir / "metrics.json", dumps(stub, indent=True))
+                    self._metrics_stubs.add(run_id)
+            else:
+                atomic_write_bytes(obs_dir / "metrics.json", dumps(metrics, indent=True))
+            self._metrics_flushed_at[run_id] = time.monotonic()
 
     def _logs_path(self, run_id: str) -> Path:
         return resolve_run_path(self.storage_root, run_id) / "observability" / "logs.jsonl"
@@ -120,12 +199,17 @@ class RunObservability(TelemetrySink):
         return ""
 
     def _forward_to_langfuse(self, event: str, entry: Dict[str, object]) -> None:
-        if not self._langfuse:
+        if self._langfuse is None:
             return
-        try:
-            self._langfuse.emit(event, dict(entry))
-        except Exception:  # pragma: no cover - telemetry best effort
-            logger.warning("Failed to forward event %s to Langfuse", event, exc_info=True)
+        if self._langfuse_batcher is None:
+            try:
+                self._langfuse.emit(event, entry)
+            except Exception:  # pragma: no cover - telemetry best effort
+                logger.warning("Failed to forward %s to Langfuse", event, exc_info=True)
+            return
+        # The entry is not touched after forwarding, so the worker can own it.
+        if not self._langfuse_batcher.put(event, entry):
+            logger.debug("Langfuse queue full; dropping event %s", event)
 
     # ---------------------------------------------------------------- helpers
     def _get_run_metadata(self, run_id: str) -> Dict[str, Any] | None:
@@ -134,46 +218,109 @@ class RunObservability(TelemetrySink):
             return cached
         index_meta = self._load_index().get(run_id)
         if index_meta:
-            self._metadata_cache[run_id] = index_meta
             return index_meta
+        # Runs without a manifest are remembered until the index changes.
+        if run_id in self._metadata_misses:
+            return None
         manifest_path = resolve_run_path(self.storage_root, run_id) / "run_manifest.json"
-        if manifest_path.exists():
-            try:
-                manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
-            except json.JSONDecodeError:
-                return None
-            metadata = {
-                "organization": manifest.get("organization", "default"),
-                "organization_slug": manifest.get("organization_slug", "default"),
-                "actor_role": manifest.get("actor_role", "qa_runner"),
-            }
-            self._metadata_cache[run_id] = metadata
-            return metadata
-        return None
+        try:
+            manifest = loads(manifest_path.read_bytes())
+        except (OSError, ValueError):
+            if len(self._metadata_misses) >= _METADATA_MISS_LIMIT:
+                self._metadata_misses.clear()
+            self._metadata_misses.add(run_id)
+            return None
+        metadata = {
+            "organization": manifest.get("organization", "default"),
+            "organization_slug": manifest.get("organization_slug", "default"),
+            "actor_role": manifest.get("actor_role", "qa_runner"),
+        }
+        self._metadata_cache[run_id] = metadata
+        return metadata
 
     def _load_index(self) -> Dict[str, Dict[str, Any]]:
         index_path = self.storage_root / "run_index.json"
-        if not index_path.exists():
-            self._run_index_mtime = None
-            return {}
         try:
-            mtime = index_path.stat().st_mtime
-        except OSError:  # pragma: no cover - filesystem race
-            return {}
+            mtime = os.stat(index_path).st_mtime_ns
+        except OSError:
+            self._run_index_mtime = None
+            return self._metadata_cache
         if self._run_index_mtime != mtime:
             try:
-                raw = json.loads(index_path.read_text(encoding="utf-8"))
-            except json.JSONDecodeError:
+                raw = loads(index_path.read_bytes())
+            except (OSError, ValueError):
                 raw = {}
             self._metadata_cache.update(
                 {run_id: metadata for run_id, metadata in raw.items() if isinstance(metadata, dict)}
             )
+            self._metadata_misses.clear()
             self._run_index_mtime = mtime
-        return {
-            run_id: metadata
-            for run_id, metadata in self._metadata_cache.items()
-            if isinstance(metadata, dict)
-        }
+        return self._metadata_cache
+
+
+def _auth_metrics(metrics: Dict[str, Any], entry: Dict[str, object]) -> None:
+    stage = entry.get("stage")
+    if not stage and entry.get("event") == "auth.skipped":
+        stage = "skipped"
+    metrics["auth"] = {
+        "stage": stage,
+        "success": bool(entry.get("success", True)),
+    }
+
+
+def _exploration_metrics(metrics: Dict[str, Any], entry: Dict[str, object]) -> None:
+    metrics["exploration"] = {
+        "coverage_percent": entry.get("coverage_percent"),
+        "visited_count": entry.get("visited_count"),
+        "skipped_count": entry.get("skipped_count"),
+    }
+
+
+def _crawl_metrics(metrics: Dict[str, Any], entry: Dict[str, object]) -> None:
+    visited = _to_int(entry.get("visited_count"))
+    skipped = _to_int(entry.get("skipped_count"))
+    summary: Dict[str, Any] = {
+        "visited_count": visited,
+        "skipped_count": skipped,
+    }
+    total = (visited or 0) + (skipped or 0)
+    if total:
+        summary["health_ratio"] = round((visited or 0) / total, 4)
+    metrics["crawl"] = summary
+
+
+def _workflow_completed_metrics(metrics: Dict[str, Any], entry: Dict[str, object]) -> None:
+    metrics.setdefault("workflow", {})["completed_at"] = entry.get("timestamp")
+    metrics["workflow"]["status"] = "Completed"
+
+
+def _workflow_failed_metrics(metrics: Dict[str, Any], entry: Dict[str, object]) -> None:
+    metrics.setdefault("workflow", {})["status"] = "Failed"
+    metrics["workflow"]["phase"] = entry.get("phase")
+    metrics["workflow"]["error"] = entry.get("error")
+
+
+_METRIC_HANDLERS: Dict[str, Callable[[Dict[str, Any], Dict[str, object]], None]] = {
+    "auth.completed": _auth_metrics,
+    "auth.skipped": _auth_metrics,
+    "exploration.completed": _exploration_metrics,
+    "crawl.completed": _crawl_metrics,
+    "workflow.completed": _workflow_completed_metrics,
+    "workflow.failed": _workflow_failed_metrics,
+}
+
+
+def _resolve_metrics_format(requested: Optional[str]) -> str:
+    """Return ``json`` or ``cbor`` from the argument or ``GAZEQA_METRICS_FORMAT``."""
+
+    value = (requested or os.getenv("GAZEQA_METRICS_FORMAT") or "json").strip().lower()
+    if value == "cbor":
+        if _cbor2 is not None:
+            return "cbor"
+        logger.warning("Metrics format 'cbor' requires the cbor2 package; writing metrics.json")
+    elif value != "json":
+        logger.warning("Unknown metrics format %r; writing metrics.json", value)
+    return "json"
 
 
 def _to_int(value: object) -> int | None:
@@ -1,33 +1,85 @@
 """Helpers for resolving run-scoped storage paths."""
 from __future__ import annotations
 
-import json
+import os
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Tuple
+
+from .json_utils import loads
+
+_CACHE_MAX_ENTRIES = 4096
+
+# Parsed run_index.json per storage root, keyed by the file's (mtime_ns, size).
+# Only organization slugs are read from it and those never change for a run.
+_INDEX_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, Dict[str, object]]]] = {}
+# Partitioned run directories found by scanning, re-checked with one stat on reuse.
+_PARTITION_CACHE: Dict[Tuple[str, str], Path] = {}
 
 
 def resolve_run_path(storage_root: Path | str, run_id: str) -> Path:
     """Return the directory for a run, accounting for organization partitions."""
 
     base = Path(storage_root)
-    index_path = base / "run_index.json"
-    if index_path.exists():
-        try:
-            index: Dict[str, Dict[str, object]] = json.loads(index_path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError:
-            index = {}
-        entry = index.get(run_id)
-        if isinstance(entry, dict):
-            slug = entry.get("organization_slug")
-            if isinstance(slug, str) and slug:
-                return base / slug / run_id
+    root_key = os.fspath(base)
+    entry = _load_index(base, root_key).get(run_id)
+    if isinstance(entry, dict):
+        slug = entry.get("organization_slug")
+        if isinstance(slug, str) and slug:
+            return base / slug / run_id
     direct = base / run_id
     if direct.exists():
         return direct
-    matches = list(base.glob(f"*/{run_id}"))
-    if matches:
-        return matches[0]
+    partition_key = (root_key, run_id)
+    cached = _PARTITION_CACHE.get(partition_key)
+    if cached is not None:
+        if cached.is_dir():
+            return cached
+        del _PARTITION_CACHE[partition_key]
+    match = _find_partitioned(root_key, run_id)
+    if match is not None:
+        if len(_PARTITION_CACHE) >= _CACHE_MAX_ENTRIES:
+            _PARTITION_CACHE.clear()
+        _PARTITION_CACHE[partition_key] = match
+        return match
     return direct
 
 
+def _find_partitioned(root: str, run_id: str) -> Path | None:
+    """Return ``<root>/<partition>/<run_id>`` for the first partition holding the run."""
+
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    candidate = os.path.join(entry.path, run_id)
+                    if os.path.isdir(candidate):
+                        return Path(candidate)
+    except OSError:
+        return None
+    return None
+
+
+def _load_index(base: Path, root_key: str) -> Dict[str, Dict[str, object]]:
+    index_path = base / "run_index.json"
+    try:
+        stat = os.stat(index_path)
+    except OSError:
+        _INDEX_CACHE.pop(root_key, None)
+        return {}
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _INDEX_CACHE.get(root_key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    try:
+        index = loads(index_path.read_bytes())
+    except (OSError, ValueError):
+        index = {}
+    if not isinstance(index, dict):
+        index = {}
+    if len(_INDEX_CACHE) >= _CACHE_MAX_ENTRIES:
+        _INDEX_CACHE.clear()
+    _INDEX_CACHE[root_key] = (signature, index)
+    return index
+
+
 __all__ = ["resolve_run_path"]
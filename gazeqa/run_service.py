@@ -1,20 +1,76 @@
 """Run service handles CreateRun lifecycle."""
 from __future__ import annotations
 
-import json
+import atexit
+import copy
+import logging
+import os
+import re
 import shutil
-import uuid
+import threading
+import weakref
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
-from typing import Callable, Dict, Iterable, List, Optional, TYPE_CHECKING
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, TYPE_CHECKING
 
 from .artifacts import ArtifactManifestBuilder
+from .file_utils import AppendHandlePool, atomic_write_bytes, ensure_dir
+from .json_utils import dumps, dumps_line, loads, safe_metadata
 from .path_utils import resolve_run_path
 from .models import CreateRunPayload, ValidationError
 
 if TYPE_CHECKING:  # pragma: no cover
     from .auth import AuthenticationOrchestrator
 
+logger = logging.getLogger(__name__)
+
+_JSON_CACHE_MAX_ENTRIES = 1024
+_CHECKPOINT_BUFFER_SIZE = 1 << 16
+_LIVE_SERVICES: "weakref.WeakSet[RunService]" = weakref.WeakSet()
+# Run IDs become directory names; anything that is not a single plain path
+# component (``..``, separators, empty) is rejected before touching the disk.
+_RUN_ID_PATTERN = re.compile(r"[A-Za-z0-9][A-Za-z0-9_-]*")
+# Statuses a run does not leave; their manifest and summary writes are synced.
+_TERMINAL_STATUSES = frozenset({"Completed", "Failed"})
+
+
+@dataclass(slots=True)
+class _RunPaths:
+    """String paths of the files inside one run directory, joined once per run."""
+
+    run_dir: Path
+    manifest: str
+    summary: str
+    events: str
+    audit: str
+    checkpoints: str
+    _resolved_dir: Optional[Path] = field(default=None, repr=False)
+
+    def resolved_dir(self) -> Path:
+        """Return ``run_dir`` with symlinks resolved, computed on first use."""
+
+        resolved = self._resolved_dir
+        if resolved is None:
+            resolved = self._resolved_dir = self.run_dir.resolve()
+        return resolved
+
+    @classmethod
+    def for_dir(cls, run_dir: Path) -> "_RunPaths":
+        base = os.fspath(run_dir)
+        join = os.path.join
+        return cls(
+            run_dir=run_dir,
+            manifest=join(base, "run_manifest.json"),
+            summary=join(base, "run_summary.json"),
+            events=join(base, "events.jsonl"),
+            audit=join(base, "audit", "audit.log.jsonl"),
+            checkpoints=join(base, "temporal", "checkpoints.jsonl"),
+        )
+
 
 class RunService:
     """Persists runs locally for prototype purposes."""
@@ -25,27 +81,158 @@ class RunService:
         auth_orchestrator: "AuthenticationOrchestrator" | None = None,
         *,
         invoke_auth_on_create: bool = True,
+        durable_index: bool = False,
     ) -> None:
         self.storage_root = Path(storage_root)
         self.storage_root.mkdir(parents=True, exist_ok=True)
         self.index_path = self.storage_root / "run_index.json"
         self.auth_orchestrator = auth_orchestrator
         self.invoke_auth_on_create = invoke_auth_on_create
-        self.status_listeners: Dict[str, List[Callable[[dict], None]]] = {}
+        # Both settings are fixed for the service's lifetime, so the create
+        # path is chosen once instead of re-checked on every call.
+        self._create_run_impl = (
+            self._create_run_with_auth
+            if invoke_auth_on_create and auth_orchestrator
+            else self._create_run_fast
+        )
+        # fsync run_index.json and its directory on every rewrite.
+        self.durable_index = durable_index
+        # Listener tuples are replaced, never mutated, so notification iterates
+        # them without a snapshot copy; the lock only serializes replacements.
+        self.status_listeners: Dict[str, Tuple[Callable[[dict], None], ...]] = {}
+        self._listeners_lock = threading.Lock()
+        # Parsed run_index.json, reused while the file's (mtime_ns, size) is unchanged.
+        self._index_cache: Optional[Dict[str, Dict[str, object]]] = None
+        self._index_signature: Optional[Tuple[int, int]] = None
+        self._index_lock = threading.RLock()
+        # Parsed manifest and summary files keyed by path, each with the
+        # (mtime_ns, size) it was read or written at. Cached values are shared
+        # and never mutated; public getters hand out deep copies.
+        self._json_cache: Dict[str, Tuple[Tuple[int, int], object]] = {}
+        self._run_paths: Dict[str, _RunPaths] = {}
+        # Status history projected from events.jsonl, keyed by run id together
+        # with the (mtime_ns, size) of the log it was built from.
+        self._history_cache: Dict[str, Tuple[Optional[Tuple[int, int]], List[Dict[str, object]]]] = {}
+        # Run logs stay open between appends. events.jsonl (the status history)
+        # and audit records are written through immediately; checkpoints.jsonl
+        # is buffered and reaches disk on flush_run()/flush() or when the
+        # buffer fills.
+        self._append_handles = AppendHandlePool()
+        self._checkpoint_buffers = AppendHandlePool(buffer_size=_CHECKPOINT_BUFFER_SIZE)
+        _LIVE_SERVICES.add(self)
+
+    def flush_run(self, run_id: str) -> None:
+        """Write out buffered checkpoint records for ``run_id``."""
+
+        paths = self._run_paths.get(run_id)
+        if paths is not None:
+            self._checkpoint_buffers.flush(paths.checkpoints)
+
+    def flush(self) -> None:
+        """Write out buffered checkpoint records for every run."""
+
+        self._checkpoint_buffers.flush()
+
+    def close(self) -> None:
+        """Flush and close the append handles kept open for run logs."""
+
+        self._checkpoint_buffers.close()
+        self._append_handles.close()
 
     def create_run(self, payload_dict: Dict[str, object]) -> Dict[str, object]:
-        payload = CreateRunPayload.from_dict(payload_dict)
+        return self._create_run_impl(CreateRunPayload.from_dict(payload_dict))
+
+    def create_runs_bulk(self, payloads: Iterable[Dict[str, object]]) -> List[Dict[str, object]]:
+        """Create several runs, rewriting ``run_index.json`` once for the batch.
+
+        Every payload is validated before any run is created, so an invalid
+        entry raises ``ValidationError`` without leaving a partial batch.
+        """
+
+        parsed = [CreateRunPayload.from_dict(payload_dict) for payload_dict in payloads]
+        index_batch: Dict[str, Dict[str, object]] = {}
+        records: List[Dict[str, object]] = []
+        try:
+            for payload in parsed:
+                records.append(self._create_run_impl(payload, index_batch=index_batch))
+        finally:
+            # Runs created before a failure are still indexed.
+            if index_batch:
+                with self._index_lock:
+                    index = self._read_index()
+                    index.update(index_batch)
+                    self._write_index(index)
+        return records
+
+    def _create_run_fast(
+        self,
+        payload: CreateRunPayload,
+        *,
+        index_batch: Optional[Dict[str, Dict[str, object]]] = None,
+    ) -> Dict[str, object]:
+        """Create a run without authenticating: Pending then Running at one timestamp."""
+
+        run_id, run_dir = self._allocate_run(payload)
+        timestamp = datetime.now(timezone.utc).isoformat()
+        history = [
+            {"status": "Pending", "timestamp": timestamp},
+            {"status": "Running", "timestamp": timestamp},
+        ]
+        run_record = self._new_run_record(run_id, payload, timestamp, history)
+        return self._finish_create(
+            run_id, run_dir, payload, run_record, None, timestamp, index_batch
+        )
+
+    def _create_run_with_auth(
+        self,
+        payload: CreateRunPayload,
+        *,
+        index_batch: Optional[Dict[str, Dict[str, object]]] = None,
+    ) -> Dict[str, object]:
+        """Create a run, authenticating first when credentials are supplied."""
+
+        if payload.credentials.is_empty():
+            return self._create_run_fast(payload, index_batch=index_batch)
+        run_id, run_dir = self._allocate_run(payload)
+        created_at = datetime.now(timezone.utc).isoformat()
+        auth_result = self.auth_orchestrator.authenticate(  # type: ignore[union-attr]
+            run_id,
+            payload.credentials,
+            run_dir=run_dir,
+            organization_slug=payload.organization_slug,
+        )
+        # Authentication can take a while, so later entries get a fresh stamp.
+        timestamp = datetime.now(timezone.utc).isoformat()
+        auth_status = "Authenticated" if auth_result.get("success") else "AuthFailed"
+        history = [
+            {"status": "Pending", "timestamp": created_at},
+            {"status": auth_status, "timestamp": timestamp},
+            {"status": "Running", "timestamp": timestamp},
+        ]
+        run_record = self._new_run_record(run_id, payload, created_at, history)
+        return self._finish_create(
+            run_id, run_dir, payload, run_record, auth_result, timestamp, index_batch
+        )
+
+    def _allocate_run(self, payload: CreateRunPayload) -> Tuple[str, Path]:
         run_id = self._generate_run_id()
         run_dir = self._run_dir(payload.organization_slug, run_id)
-        run_dir.parent.mkdir(parents=True, exist_ok=True)
-        timestamp = datetime.now(timezone.utc).isoformat()
+        ensure_dir(run_dir.parent)
+        return run_id, run_dir
 
-        run_record: Dict[str, object] = {
+    @staticmethod
+    def _new_run_record(
+        run_id: str,
+        payload: CreateRunPayload,
+        created_at: str,
+        history: List[Dict[str, object]],
+    ) -> Dict[str, object]:
+        # Runs are persisted already in the Running state; history keeps the
+        # states passed through on the way there.
+        return {
             "id": run_id,
-            "status": "Pending",
-            "status_history": [
-                {"status": "Pending", "timestamp": timestamp}
-            ],
+            "status": "Running",
+            "status_history": history,
             "target_url": payload.target_url,
             "credentials": {
                 "username": payload.credentials.username,
@@ -57,54 +244,45 @@ class RunService:
             },
             "storage_profile": payload.storage_profile,
             "tags": payload.tags,
-            "created_at": timestamp,
+            "created_at": created_at,
             "organization": payload.organization,
             "organization_slug": payload.organization_slug,
             "actor_role": payload.actor_role,
         }
 
-        auth_result: Optional[dict] = None
-        if (
-            self.invoke_auth_on_create
-            and self.auth_orchestrator
-            and not payload.credentials.is_empty()
-        ):
-            auth_result = self.auth_orchestrator.authenticate(
-                run_id,
-                payload.credentials,
-                run_dir=run_dir,
-                organization_slug=payload.organization_slug,
-            )
-            status = "Authenticated" if auth_result.get("success") else "AuthFailed"
-            run_record["status"] = status
-            run_record.setdefault("status_history", []).append(
-                {"status": status, "timestamp": datetime.now(timezone.utc).isoformat()}
-            )
-
-        # Transition to running state once persisted
-        run_record["status"] = "Running"
-        run_record.setdefault("status_history", []).append(
-            {"status": "Running", "timestamp": datetime.now(timezone.utc).isoformat()}
-        )
-
-        self._persist_run(run_id, run_dir, run_record, auth_result)
+    def _finish_create(
+        self,
+        run_id: str,
+        run_dir: Path,
+        payload: CreateRunPayload,
+        run_record: Dict[str, object],
+        auth_result: Optional[dict],
+        timestamp: str,
+        index_batch: Optional[Dict[str, Dict[str, object]]] = None,
+    ) -> Dict[str, object]:
+        paths = self._remember_paths(run_id, run_dir)
+        self._persist_run(run_id, paths, run_record, auth_result)
         event = {
             "event": "run.created",
             "run_id": run_id,
             "status": run_record["status"],
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": timestamp,
         }
-        self._append_event(run_dir, event)
-        self._append_status_history(run_dir, event)
-        self._notify_listeners(run_id, event)
-        self._update_index(
-            run_id,
-            {
-                "organization": payload.organization,
-                "organization_slug": payload.organization_slug,
-                "actor_role": payload.actor_role,
-            },
+        self._append_line(paths.events, event)
+        # The creation history already ends with the "Running" entry this event carries.
+        self._remember_history(
+            run_id, self._events_signature(paths), _copy_history(run_record["status_history"])
         )
+        self._notify_listeners(run_id, event)
+        index_entry = {
+            "organization": payload.organization,
+            "organization_slug": payload.organization_slug,
+            "actor_role": payload.actor_role,
+        }
+        if index_batch is None:
+            self._update_index(run_id, index_entry)
+        else:
+            index_batch[run_id] = index_entry
         self.log_audit_event(
             run_id,
             "run.create",
@@ -112,30 +290,23 @@ class RunService:
                 "status": run_record["status"],
                 "organization_slug": payload.organization_slug,
             },
+            timestamp=timestamp,
         )
         return run_record
 
     def get_run(self, run_id: str) -> Dict[str, object]:
-        run_dir = self._resolve_run_dir(run_id)
-        manifest_path = run_dir / "run_manifest.json"
-        if not manifest_path.exists():
-            raise FileNotFoundError(f"Run {run_id} not found")
-        return json.loads(manifest_path.read_text(encoding="utf-8"))
+        return copy.deepcopy(self._load_manifest(self._paths(run_id), run_id))
 
     def list_runs(self) -> List[Dict[str, object]]:
-        index = self._read_index()
-        entries: List[Dict[str, object]] = []
-        for run_id, metadata in index.items():
-            entry = {"id": run_id}
-            if isinstance(metadata, dict):
-                entry.update(metadata)
-            entries.append(entry)
+        entries = _index_entries(self._read_index())
         if not entries:
-            for manifest in sorted(self.storage_root.glob("**/run_manifest.json")):
+            seen: set[str] = set()
+            for manifest in self._scan_manifests():
                 run_dir = manifest.parent
                 run_id = run_dir.name
-                if any(item.get("id") == run_id for item in entries):
+                if run_id in seen:
                     continue
+                seen.add(run_id)
                 org_dir = run_dir.parent
                 organization_slug = org_dir.name if org_dir != self.storage_root else "default"
                 entries.append(
@@ -145,7 +316,7 @@ class RunService:
                         "organization": organization_slug,
                     }
                 )
-        return sorted(entries, key=lambda item: item.get("id", ""))
+        return sorted(entries, key=itemgetter("id"))
 
     def build_artifact_manifest(self, run_id: str) -> Dict[str, object]:
         metadata = self._get_index_entry(run_id)
@@ -153,7 +324,8 @@ class RunService:
         builder = ArtifactManifestBuilder(self.storage_root)
         manifest = builder.build(run_id, organization_slug=organization_slug)
         if organization_slug:
-            manifest.setdefault("organization_slug", organization_slug)
+            # The builder never sets this key, so assign it directly.
+            manifest["organization_slug"] = organization_slug
         return manifest
 
     def get_artifact_path(
@@ -163,19 +335,30 @@ class RunService:
         *,
         organization_slug: str | None = None,
     ) -> Path:
+        # Absolute paths and ones climbing out of the run are refused lexically,
+        # before any lookup or stat.
+        normalized = os.path.normpath(relative_path)
+        if os.path.isabs(normalized) or normalized == os.pardir or normalized.startswith(
+            os.pardir + os.sep
+        ):
+            raise ValueError("invalid artifact path")
         if organization_slug:
             metadata = self.get_run_metadata(run_id)
             expected = metadata.get("organization_slug")
             if expected and expected != organization_slug:
                 raise ValueError("organization context mismatch")
             run_dir = self._run_dir(organization_slug, run_id)
-            if not run_dir.exists() or not run_dir.is_dir():
-                run_dir = self._resolve_run_dir(run_id)
+            paths = self._run_paths.get(run_id)
+            if paths is None or paths.run_dir != run_dir:
+                paths = self._remember_paths(run_id, run_dir) if run_dir.is_dir() else self._paths(run_id)
         else:
-            run_dir = self._resolve_run_dir(run_id)
-        candidate = (run_dir / relative_path).resolve()
-        base = run_dir.resolve()
-        if not str(candidate).startswith(str(base)):
+            paths = self._paths(run_id)
+        base = paths.resolved_dir()
+        candidate = (base / normalized).resolve()
+        # Symlinks inside the run can still point elsewhere, so the resolved
+        # path is checked component-wise; a string prefix test would accept
+        # "<run>-other/...".
+        if not candidate.is_relative_to(base):
             raise ValueError("invalid artifact path")
         return candidate
 
@@ -194,51 +377,62 @@ class RunService:
         }
 
     def get_status_history(self, run_id: str) -> List[Dict[str, object]]:
-        run_dir = self._resolve_run_dir(run_id)
-        history_path = run_dir / "status_history.json"
-        if history_path.exists():
-            return json.loads(history_path.read_text(encoding="utf-8"))
-        manifest = self.get_run(run_id)
-        history = manifest.get("status_history")
-        if history:
-            return history  # type: ignore[return-value]
-        return [
-            {
-                "status": manifest.get("status", "Pending"),
-                "timestamp": manifest.get("created_at"),
-            }
-        ]
+        return copy.deepcopy(self._load_history(self._paths(run_id), run_id))
 
     def record_checkpoint(
         self,
         run_id: str,
         checkpoint: str,
         details: Optional[Dict[str, object]] = None,
+        *,
+        timestamp: Optional[str] = None,
     ) -> None:
-        run_dir = self._resolve_run_dir(run_id)
-        path = run_dir / "temporal" / "checkpoints.jsonl"
-        path.parent.mkdir(parents=True, exist_ok=True)
+        paths = self._paths(run_id)
         payload = {
             "run_id": run_id,
             "checkpoint": checkpoint,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": timestamp or datetime.now(timezone.utc).isoformat(),
         }
         if details:
             payload.update(details)
-        with path.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(payload) + "\n")
+        self._checkpoint_buffers.append(paths.checkpoints, dumps_line(payload))
+
+    def record_checkpoints(
+        self,
+        run_id: str,
+        checkpoints: Iterable[Tuple[str, Optional[Dict[str, object]], Optional[str]]],
+    ) -> None:
+        """Append ``(checkpoint, details, timestamp)`` records in one buffered write."""
+
+        lines: List[bytes] = []
+        now: Optional[str] = None
+        for checkpoint, details, timestamp in checkpoints:
+            if timestamp is None:
+                now = now or datetime.now(timezone.utc).isoformat()
+                timestamp = now
+            payload = {"run_id": run_id, "checkpoint": checkpoint, "timestamp": timestamp}
+            if details:
+                payload.update(details)
+            lines.append(dumps_line(payload))
+        if lines:
+            self._checkpoint_buffers.append(self._paths(run_id).checkpoints, b"".join(lines))
 
     def rebuild_index(self, *, move_legacy: bool = False) -> Dict[str, Dict[str, object]]:
         """Rebuild run_index.json and optionally migrate legacy directories."""
 
         index: Dict[str, Dict[str, object]] = {}
-        manifests = sorted(self.storage_root.glob("**/run_manifest.json"))
-        for manifest_path in manifests:
+        # Runs may resolve elsewhere once the index is rewritten.
+        self._run_paths.clear()
+        if move_legacy:
+            # Pooled handles are keyed by path; drop them before directories move.
+            self._checkpoint_buffers.close()
+            self._append_handles.close()
+        for manifest_path in self._scan_manifests():
             run_dir = manifest_path.parent
             run_id = run_dir.name
             try:
-                manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
-            except json.JSONDecodeError:
+                manifest = loads(manifest_path.read_bytes())
+            except ValueError:
                 continue
             organization_slug = str(manifest.get("organization_slug") or "default").strip() or "default"
             organization = str(manifest.get("organization") or organization_slug)
@@ -265,25 +459,15 @@ class RunService:
         status: str,
         metadata: Optional[Dict[str, object]] = None,
     ) -> None:
-        run_dir = self._resolve_run_dir(run_id)
+        paths = self._paths(run_id)
         timestamp = datetime.now(timezone.utc).isoformat()
-        history = self.get_status_history(run_id)
-        history.append({"status": status, "timestamp": timestamp})
-        (run_dir / "status_history.json").write_text(json.dumps(history, indent=2), encoding="utf-8")
-
-        manifest = self.get_run(run_id)
-        manifest["status"] = status
-        manifest.setdefault("status_history", history)
-        if metadata:
-            manifest.setdefault("status_metadata", {}).update(metadata)
-        (run_dir / "run_manifest.json").write_text(json.dumps(manifest, indent=2), encoding="utf-8")
-
-        summary_path = run_dir / "run_summary.json"
-        if summary_path.exists():
-            summary = json.loads(summary_path.read_text(encoding="utf-8"))
-            summary["status"] = status
-            summary["status_history"] = history
-            summary_path.write_text(json.dumps(summary, indent=2), encoding="utf-8")
+        # History is projected from events.jsonl, so a status change appends one
+        # event instead of rewriting a history file. Repeating the current status
+        # leaves the summary that mirrors the history untouched.
+        history = self._load_history(paths, run_id)
+        status_changed = not history or history[-1].get("status") != status
+        if status_changed:
+            history = [*history, {"status": status, "timestamp": timestamp}]
 
         event = {
             "event": "run.status",
@@ -293,54 +477,106 @@ class RunService:
         }
         if metadata:
             event["metadata"] = metadata
-        self._append_event(run_dir, event)
-        self._append_status_history(run_dir, event)
+        # Intermediate states are cheap to lose in a crash; the final one is
+        # synced to disk. The event is written first, so a manifest showing a
+        # status never runs ahead of the history in events.jsonl.
+        durable = status in _TERMINAL_STATUSES
+        self._append_line(paths.events, event)
+        if durable:
+            self._append_handles.sync(paths.events)
+
+        if status_changed or metadata:
+            manifest = dict(self._load_manifest(paths, run_id))
+            manifest["status"] = status
+            if metadata:
+                status_metadata = dict(manifest.get("status_metadata") or {})
+                status_metadata.update(metadata)
+                manifest["status_metadata"] = status_metadata
+            self._store_json(paths.manifest, manifest, durable=durable)
+
+        if status_changed:
+            summary = self._load_json(paths.summary)
+            if summary is not None:
+                summary = dict(summary)
+                summary["status"] = status
+                summary["status_history"] = history
+                self._store_json(paths.summary, summary, durable=durable)
+
+        self._remember_history(run_id, self._events_signature(paths), history)
         self._notify_listeners(run_id, event)
 
     def register_listener(self, run_id: str, callback: Callable[[dict], None]) -> None:
-        self.status_listeners.setdefault(run_id, []).append(callback)
+        with self._listeners_lock:
+            self.status_listeners[run_id] = (*self.status_listeners.get(run_id, ()), callback)
 
     def unregister_listener(self, run_id: str, callback: Callable[[dict], None]) -> None:
-        listeners = self.status_listeners.get(run_id)
-        if not listeners:
+        with self._listeners_lock:
+            listeners = self.status_listeners.get(run_id)
+            if not listeners or callback not in listeners:
+                return
+            # Drop only the first registration, as list.remove did.
+            position = listeners.index(callback)
+            remaining = listeners[:position] + listeners[position + 1 :]
+            if remaining:
+                self.status_listeners[run_id] = remaining
+            else:
+                del self.status_listeners[run_id]
+
+    def get_run_events(self, run_id: str) -> List[Dict[str, object]]:
+        return list(self.iter_run_events(run_id))
+
+    def iter_run_events(
+        self,
+        run_id: str,
+        *,
+        limit: Optional[int] = None,
+        since_ts: Optional[str | datetime] = None,
+        tail: bool = False,
+    ) -> Iterator[Dict[str, object]]:
+        """Yield events from ``events.jsonl`` one line at a time.
+
+        ``since_ts`` keeps events stamped strictly after it, compared as
+        datetimes (naive values are UTC; an unparseable one raises
+        ``ValueError``), and ``limit`` stops after that many events. With
+        ``tail`` the last ``limit`` matching events are yielded instead of the
+        first; blank and malformed lines never count towards ``limit``.
+        """
+
+        since = None
+        if since_ts is not None:
+            since = _parse_timestamp(since_ts)
+            if since is None:
+                raise ValueError(f"Invalid timestamp: {since_ts!r}")
+        paths = self._paths(run_id)
+        if limit is not None and limit <= 0:
             return
         try:
-            listeners.remove(callback)
-        except ValueError:
+            handle = open(paths.events, "rb")
+        except FileNotFoundError:
             return
-        if not listeners:
-            self.status_listeners.pop(run_id, None)
-
-    def get_run_events(self, run_id: str) -> List[Dict[str, object]]:
-        run_dir = self._resolve_run_dir(run_id)
-        events_path = run_dir / "events.jsonl"
-        if not events_path.exists():
-            return []
-        events: List[Dict[str, object]] = []
-        with events_path.open("r", encoding="utf-8") as handle:
-            for line in handle:
-                line = line.strip()
-                if line:
-                    try:
-                        events.append(json.loads(line))
-                    except json.JSONDecodeError:
-                        continue
-        return events
+        with handle:
+            events = _filter_events(handle, since)
+            if tail and limit is not None:
+                yield from deque(events, maxlen=limit)
+            else:
+                yield from islice(events, limit)
 
     def _generate_run_id(self) -> str:
-        return f"RUN-{uuid.uuid4().hex[:12].upper()}"
+        # 48 random bits, the same as the first 12 hex digits of a uuid4.
+        # secrets.token_hex is os.urandom plus a wrapper call; go direct.
+        return f"RUN-{os.urandom(6).hex().upper()}"
 
     def _persist_run(
         self,
         run_id: str,
-        run_dir: Path,
+        paths: _RunPaths,
         run_record: Dict[str, object],
         auth_result: Optional[dict],
     ) -> None:
+        run_dir = paths.run_dir
         run_dir.mkdir(parents=True, exist_ok=True)
-
-        manifest_path = run_dir / "run_manifest.json"
-        manifest_path.write_text(json.dumps(run_record, indent=2), encoding="utf-8")
+        # The caller keeps run_record, so the cached copies are detached from it.
+        history = _copy_history(run_record["status_history"])
 
         summary: Dict[str, object] = {
             "run_id": run_id,
@@ -348,17 +584,11 @@ class RunService:
             "tests": [],
             "criteria": [],
             "status": run_record.get("status"),
-            "status_history": run_record.get("status_history", []),
+            "status_history": history,
             "organization": run_record.get("organization"),
             "organization_slug": run_record.get("organization_slug"),
             "actor_role": run_record.get("actor_role"),
         }
-        summary_path = run_dir / "run_summary.json"
-        summary_path.write_text(json.dumps(summary, indent=2), encoding="utf-8")
-
-        history_path = run_dir / "status_history.json"
-        history_path.write_text(json.dumps(run_record.get("status_history", []), indent=2), encoding="utf-8")
-
         if auth_result:
             summary["auth"] = {
                 "stage": auth_result.get("stage"),
@@ -371,32 +601,119 @@ class RunService:
                 ),
                 "metadata": auth_result.get("metadata", {}),
             }
-            summary_path.write_text(json.dumps(summary, indent=2), encoding="utf-8")
 
-    def _append_event(self, run_dir: Path, event: Dict[str, object]) -> None:
-        events_path = run_dir / "events.jsonl"
-        events_path.parent.mkdir(parents=True, exist_ok=True)
-        with events_path.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(event) + "\n")
+        # Each file is serialized once and written in a single call.
+        self._store_json(paths.manifest, _copy_new_record(run_record))
+        self._store_json(paths.summary, summary)
+
+    def _paths(self, run_id: str) -> _RunPaths:
+        # Cache hits cost no syscalls; the entry is dropped when the run's
+        # manifest turns out to be missing and on every index rebuild.
+        paths = self._run_paths.get(run_id)
+        if paths is not None:
+            return paths
+        if not _RUN_ID_PATTERN.fullmatch(run_id):
+            raise FileNotFoundError(f"Run {run_id} not found")
+        candidate = resolve_run_path(self.storage_root, run_id)
+        if candidate.is_dir():
+            return self._remember_paths(run_id, candidate)
+        raise FileNotFoundError(f"Run {run_id} not found")
+
+    def _remember_paths(self, run_id: str, run_dir: Path) -> _RunPaths:
+        if len(self._run_paths) >= _JSON_CACHE_MAX_ENTRIES:
+            self._run_paths.clear()
+        paths = self._run_paths[run_id] = _RunPaths.for_dir(run_dir)
+        return paths
 
-    def _append_status_history(self, run_dir: Path, event: Dict[str, object]) -> None:
-        history_path = run_dir / "status_history.json"
+    def _append_line(self, path: str, record: Dict[str, object]) -> None:
+        self._append_handles.append(path, dumps_line(record))
+
+    def _load_manifest(self, paths: _RunPaths, run_id: str) -> Dict[str, object]:
+        manifest = self._load_json(paths.manifest)
+        if manifest is None:
+            self._run_paths.pop(run_id, None)
+            raise FileNotFoundError(f"Run {run_id} not found")
+        return manifest  # type: ignore[return-value]
+
+    def _load_history(self, paths: _RunPaths, run_id: str) -> List[Dict[str, object]]:
+        """Return the run's creation history followed by its ``run.status`` events."""
+
+        # The cached projection is valid while the file on disk is unchanged.
+        signature = self._events_signature(paths)
+        cached = self._history_cache.get(run_id)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        manifest = self._load_manifest(paths, run_id)
+        # The manifest keeps the history recorded at creation; later changes
+        # live only in events.jsonl.
+        history: List[Dict[str, object]] = list(manifest.get("status_history") or [])
+        if signature is not None:
+            for event in self.iter_run_events(run_id):
+                if isinstance(event, dict) and event.get("event") == "run.status":
+                    _append_history(history, event)
+        if not history:
+            history = [
+                {
+                    "status": manifest.get("status", "Pending"),
+                    "timestamp": manifest.get("created_at"),
+                }
+            ]
+        self._remember_history(run_id, signature, history)
+        return history
+
+    def _events_signature(self, paths: _RunPaths) -> Optional[Tuple[int, int]]:
         try:
-            history = json.loads(history_path.read_text(encoding="utf-8")) if history_path.exists() else []
-        except json.JSONDecodeError:
-            history = []
-        status = event.get("status")
-        timestamp = event.get("timestamp")
-        if status is None or timestamp is None:
-            return
-        entry = {"status": status, "timestamp": timestamp}
-        if history and history[-1].get("status") == status:
-            return
-        history.append(entry)
-        history_path.write_text(json.dumps(history, indent=2), encoding="utf-8")
+            stat = os.stat(paths.events)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _remember_history(
+        self,
+        run_id: str,
+        signature: Optional[Tuple[int, int]],
+        history: List[Dict[str, object]],
+    ) -> None:
+        cache = self._history_cache
+        if len(cache) >= _JSON_CACHE_MAX_ENTRIES and run_id not in cache:
+            cache.clear()
+        cache[run_id] = (signature, history)
+
+    def _load_json(self, key: str) -> object | None:
+        """Return the parsed contents of ``key`` (shared, do not mutate), or ``None`` if missing."""
+
+        try:
+            stat = os.stat(key)
+        except FileNotFoundError:
+            self._json_cache.pop(key, None)
+            return None
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = self._json_cache.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        with open(key, "rb") as handle:
+            data = loads(handle.read())
+        self._remember_json(key, signature, data)
+        return data
+
+    def _store_json(self, key: str, data: object, *, durable: bool = False) -> None:
+        try:
+            # Readers never observe a truncated manifest or summary.
+            atomic_write_bytes(key, dumps(data), durable=durable)
+            stat = os.stat(key)
+        except BaseException:
+            self._json_cache.pop(key, None)
+            raise
+        self._remember_json(key, (stat.st_mtime_ns, stat.st_size), data)
+
+    def _remember_json(self, key: str, signature: Tuple[int, int], data: object) -> None:
+        cache = self._json_cache
+        if len(cache) >= _JSON_CACHE_MAX_ENTRIES and key not in cache:
+            cache.clear()
+        cache[key] = (signature, data)
 
     def _notify_listeners(self, run_id: str, event: dict) -> None:
-        for callback in list(self.status_listeners.get(run_id, [])):
+        for callback in self.status_listeners.get(run_id, ()):
             try:
                 callback(event)
             except Exception:  # pragma: no cover
@@ -407,39 +724,90 @@ class RunService:
         run_id: str,
         event: str,
         details: Dict[str, object] | None = None,
+        *,
+        timestamp: str | None = None,
     ) -> None:
-        run_dir = self._resolve_run_dir(run_id)
-        audit_dir = run_dir / "audit"
-        audit_dir.mkdir(parents=True, exist_ok=True)
+        """Append an audit record; pass ``timestamp`` to reuse the caller's clock reading."""
+
+        paths = self._paths(run_id)
         payload: Dict[str, object] = {
             "event": event,
             "run_id": run_id,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": timestamp or datetime.now(timezone.utc).isoformat(),
         }
         if details:
-            payload.update(_safe_metadata(details))
-        with (audit_dir / "audit.log.jsonl").open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(payload) + "\n")
+            payload.update(safe_metadata(details))
+        self._append_line(paths.audit, payload)
 
     def _run_dir(self, organization_slug: str | None, run_id: str) -> Path:
         slug = organization_slug or "default"
         return self.storage_root / slug / run_id
 
-    def _read_index(self) -> Dict[str, Dict[str, object]]:
-        if not self.index_path.exists():
-            return {}
+    def _scan_manifests(self) -> List[Path]:
+        """Return run manifests under ``<root>/<org>/<run>`` and legacy ``<root>/<run>``."""
+
+        found: List[str] = []
         try:
-            return json.loads(self.index_path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError:
-            return {}
+            with os.scandir(self.storage_root) as top_entries:
+                top_dirs = [entry.path for entry in top_entries if entry.is_dir()]
+        except FileNotFoundError:
+            return []
+        for top_dir in top_dirs:
+            legacy_manifest = os.path.join(top_dir, "run_manifest.json")
+            if os.path.isfile(legacy_manifest):
+                found.append(legacy_manifest)
+            try:
+                with os.scandir(top_dir) as run_entries:
+                    for run_entry in run_entries:
+                        if run_entry.is_dir():
+                            manifest = os.path.join(run_entry.path, "run_manifest.json")
+                            if os.path.isfile(manifest):
+                                found.append(manifest)
+            except OSError:
+                continue
+        return sorted(map(Path, found))
+
+    def _read_index(self) -> Dict[str, Dict[str, object]]:
+        with self._index_lock:
+            try:
+                stat = os.stat(self.index_path)
+            except FileNotFoundError:
+                self._index_cache = None
+                self._index_signature = None
+                return {}
+            signature = (stat.st_mtime_ns, stat.st_size)
+            if self._index_cache is not None and self._index_signature == signature:
+                return self._index_cache
+            try:
+                index = loads(self.index_path.read_bytes())
+            except ValueError:
+                logger.warning("Ignoring unreadable run index at %s", self.index_path)
+                index = {}
+            if not isinstance(index, dict):
+                logger.warning("Ignoring run index at %s: expected an object", self.index_path)
+                index = {}
+            self._index_cache = index
+            self._index_signature = signature
+            return index
 
     def _write_index(self, index: Dict[str, Dict[str, object]]) -> None:
-        self.index_path.write_text(json.dumps(index, indent=2), encoding="utf-8")
+        with self._index_lock:
+            try:
+                # Readers see either the old or the new index, never a partial one.
+                atomic_write_bytes(self.index_path, dumps(index), durable=self.durable_index)
+                stat = os.stat(self.index_path)
+            except BaseException:
+                self._index_cache = None
+                self._index_signature = None
+                raise
+            self._index_cache = index
+            self._index_signature = (stat.st_mtime_ns, stat.st_size)
 
     def _update_index(self, run_id: str, metadata: Dict[str, object]) -> None:
-        index = self._read_index()
-        index[run_id] = metadata
-        self._write_index(index)
+        with self._index_lock:
+            index = self._read_index()
+            index[run_id] = metadata
+            self._write_index(index)
 
     def _get_index_entry(self, run_id: str) -> Dict[str, object]:
         index = self._read_index()
@@ -447,26 +815,34 @@ class RunService:
         return dict(entry) if isinstance(entry, dict) else {}
 
     def _resolve_run_dir(self, run_id: str) -> Path:
-        candidate = resolve_run_path(self.storage_root, run_id)
-        if candidate.exists() and candidate.is_dir():
-            return candidate
-        raise FileNotFoundError(f"Run {run_id} not found")
+        return self._paths(run_id).run_dir
 
 
     @staticmethod
     def _to_relative_path(path_value: Optional[str], run_dir: Path) -> Optional[str]:
         if not path_value:
             return None
+        value = str(path_value)
+        base = os.fspath(run_dir) + os.sep
+        if value.startswith(base) and len(value) > len(base):
+            return value[len(base) :]
         try:
             path = Path(path_value)
             return str(path.relative_to(run_dir))
         except ValueError:
-            return str(path_value)
+            return value
 
     @staticmethod
     def _normalize_evidence(paths: Iterable[str], run_dir: Path) -> List[str]:
+        # Paths under the run directory are trimmed with a string prefix test;
+        # anything else keeps the Path-based handling.
+        base = os.fspath(run_dir) + os.sep
+        cut = len(base)
         normalized: List[str] = []
-        for item in paths:
+        for item in map(str, paths):
+            if item.startswith(base) and len(item) > cut:
+                normalized.append(item[cut:])
+                continue
             candidate = Path(item)
             try:
                 normalized.append(str(candidate.relative_to(run_dir)))
@@ -475,14 +851,86 @@ class RunService:
         return normalized
 
 
-def _safe_metadata(metadata: Dict[str, object]) -> Dict[str, object]:
-    safe: Dict[str, object] = {}
-    for key, value in metadata.items():
-        if isinstance(value, (str, int, float, bool)) or value is None:
-            safe[key] = value
-        else:
-            safe[key] = str(value)
-    return safe
+def _filter_events(lines: Iterable[bytes], since: Optional[datetime]) -> Iterator[Dict[str, object]]:
+    """Parse JSONL ``lines``, skipping blank or malformed ones and any not after ``since``."""
+
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            event = loads(line)
+        except ValueError:
+            continue
+        if since is not None:
+            stamp = _parse_timestamp(event.get("timestamp")) if isinstance(event, dict) else None
+            if stamp is None or stamp <= since:
+                continue
+        yield event
+
+
+def _parse_timestamp(value: object) -> Optional[datetime]:
+    """Return ``value`` as an aware datetime, or None if it is not ISO 8601."""
+
+    if isinstance(value, datetime):
+        parsed = value
+    elif isinstance(value, str):
+        try:
+            parsed = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    else:
+        return None
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=timezone.utc)
+
+
+def _append_history(history: List[Dict[str, object]], event: Dict[str, object]) -> None:
+    status = event.get("status")
+    timestamp = event.get("timestamp")
+    if status is None or timestamp is None:
+        return
+    if history and history[-1].get("status") == status:
+        return
+    history.append({"status": status, "timestamp": timestamp})
+
+
+def _copy_history(history: List[Dict[str, object]]) -> List[Dict[str, object]]:
+    """Copy history built by this module, whose entries hold only strings."""
+
+    return [dict(entry) for entry in history]
+
+
+def _copy_new_record(record: Dict[str, object]) -> Dict[str, object]:
+    """Detach a record from ``_new_run_record`` without a generic deep copy.
+
+    Only the containers that function creates are nested, so copying those
+    one level down is equivalent to ``copy.deepcopy`` and much cheaper.
+    """
+
+    copied = dict(record)
+    copied["status_history"] = _copy_history(record["status_history"])  # type: ignore[arg-type]
+    copied["credentials"] = dict(record["credentials"])  # type: ignore[arg-type]
+    copied["budgets"] = dict(record["budgets"])  # type: ignore[arg-type]
+    copied["tags"] = list(record["tags"])  # type: ignore[arg-type]
+    return copied
+
+
+def _index_entries(index: Dict[str, Dict[str, object]]) -> List[Dict[str, object]]:
+    """Flatten ``run_index.json`` into ``{"id": ..., **metadata}`` entries."""
+
+    return [
+        {"id": run_id, **metadata} if isinstance(metadata, dict) else {"id": run_id}
+        for run_id, metadata in index.items()
+    ]
+
+
+@atexit.register
+def _flush_live_services() -> None:
+    for service in list(_LIVE_SERVICES):
+        try:
+            service.flush()
+        except Exception:  # pragma: no cover - best effort at shutdown
+            logger.exception("Failed to flush run logs at exit")
 
 
 __all__ = ["RunService", "ValidationError"]
@@ -4,28 +4,30 @@ from __future__ import annotations
 import json
 import logging
 import os
+import sys
 import threading
+import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Iterable, Optional
 
 logger = logging.getLogger(__name__)
 
-ROLE_DEFAULT_SCOPES: dict[str, set[str]] = {
-    "qa_runner": {"runs:create", "runs:read", "runs:events"},
-    "qa_viewer": {"runs:read", "runs:events"},
-    "admin": {"runs:create", "runs:read", "runs:events", "runs:read:all"},
+# Scope sets are immutable sorted tuples, handed out as-is without copying.
+ROLE_DEFAULT_SCOPES: dict[str, tuple[str, ...]] = {
+    "qa_runner": ("runs:create", "runs:events", "runs:read"),
+    "qa_viewer": ("runs:events", "runs:read"),
+    "admin": ("runs:create", "runs:events", "runs:read", "runs:read:all"),
 }
 
-DEFAULT_OPEN_SCOPES = {"runs:create", "runs:read", "runs:events", "runs:read:all"}
+DEFAULT_OPEN_SCOPES: tuple[str, ...] = ("runs:create", "runs:events", "runs:read", "runs:read:all")
 
 
-def scopes_for_role(role: str) -> list[str]:
-    """Return the default scope list for a role."""
+def scopes_for_role(role: str) -> tuple[str, ...]:
+    """Return the default scopes for a role as a shared sorted tuple."""
 
-    fallback = ROLE_DEFAULT_SCOPES.get("qa_viewer", set())
-    scopes = ROLE_DEFAULT_SCOPES.get(role, fallback)
-    return sorted(scopes)
+    fallback = ROLE_DEFAULT_SCOPES.get("qa_viewer", ())
+    return ROLE_DEFAULT_SCOPES.get(role, fallback)
 
 
 def normalize_registry_entry(token: str, value: object) -> Optional[dict[str, Any]]:
@@ -46,13 +48,15 @@ def normalize_registry_entry(token: str, value: object) -> Optional[dict[str, An
     actor_role = str(value.get("actor_role") or "qa_viewer").strip() or "qa_viewer"
     scopes_raw = value.get("scopes")
     if isinstance(scopes_raw, (list, tuple, set)):
-        scopes = sorted({str(item).strip() for item in scopes_raw if item})
+        scopes = tuple(sorted({sys.intern(str(item).strip()) for item in scopes_raw if item}))
     else:
         scopes = scopes_for_role(actor_role)
+    # Organizations, roles and scopes repeat across tokens; interning lets every
+    # entry in a large registry share one string object per distinct value.
     return {
-        "organization": organization or organization_slug,
-        "organization_slug": organization_slug,
-        "actor_role": actor_role,
+        "organization": sys.intern(organization or organization_slug),
+        "organization_slug": sys.intern(organization_slug),
+        "actor_role": sys.intern(actor_role),
         "scopes": scopes,
     }
 
@@ -97,7 +101,12 @@ class SigningKeySet:
 
 
 class SecretsManager:
-    """Hot-reloads API tokens and signing keys from files."""
+    """Hot-reloads API tokens and signing keys from files.
+
+    Each file is re-parsed only when its ``(st_mtime_ns, st_size)`` changes.
+    With ``stat_ttl`` greater than zero the files are stat'ed at most once per
+    that many seconds, so a rotation can take up to ``stat_ttl`` to apply.
+    """
 
     def __init__(
         self,
@@ -110,15 +119,21 @@ class SecretsManager:
         signing_key: Optional[str] = None,
         signing_key_previous: Iterable[str] | None = None,
         signing_key_file: str | Path | None = None,
+        stat_ttl: float = 0.0,
     ) -> None:
+        # Readers use the published (checked_at, value) snapshots without the
+        # lock; it is taken only to re-stat the files and publish a new one.
         self._lock = threading.Lock()
+        self._stat_ttl = stat_ttl
+        self._token_snapshot: Optional[tuple[float, dict[str, dict[str, Any]]]] = None
+        self._signing_snapshot: Optional[tuple[float, SigningKeySet]] = None
         self._base_registry = load_token_registry(default_token, registry_json)
         self._registry_file = Path(registry_file) if registry_file else None
-        self._registry_file_mtime: float | None = None
+        self._registry_file_signature: tuple[int, int] | None = None
         self._registry_override: dict[str, dict[str, Any]] = {}
 
         self._token_file = Path(token_file) if token_file else None
-        self._token_file_mtime: float | None = None
+        self._token_file_signature: tuple[int, int] | None = None
         self._token_file_entry: dict[str, dict[str, Any]] = {}
         self._token_defaults = token_file_defaults or {
             "organization": "default",
@@ -131,16 +146,30 @@ class SecretsManager:
             key.strip() for key in (signing_key_previous or ()) if key and key.strip()
         )
         self._signing_key_file = Path(signing_key_file) if signing_key_file else None
-        self._signing_key_file_mtime: float | None = None
+        self._signing_key_file_signature: tuple[int, int] | None = None
         self._signing_key_file_keys: tuple[str, ...] = ()
 
     # ------------------------------------------------------------------ tokens
     def get_token_registry(self) -> dict[str, dict[str, Any]]:
-        with self._lock:
-            self._refresh_token_sources_locked()
-            return self._compose_registry_locked()
+        """Return the merged token registry; the dict is shared, do not mutate it."""
 
-    def _refresh_token_sources_locked(self) -> None:
+        snapshot = self._token_snapshot
+        if snapshot is not None and time.monotonic() - snapshot[0] < self._stat_ttl:
+            return snapshot[1]
+        with self._lock:
+            snapshot = self._token_snapshot
+            now = time.monotonic()
+            if snapshot is not None and now - snapshot[0] < self._stat_ttl:
+                return snapshot[1]
+            changed = self._refresh_token_sources_locked()
+            registry = (
+                self._compose_registry_locked() if changed or snapshot is None else snapshot[1]
+            )
+            self._token_snapshot = (now, registry)
+            return registry
+
+    def _refresh_token_sources_locked(self) -> bool:
+        changed = False
         if self._registry_file:
             try:
                 stat = self._registry_file.stat()
@@ -148,11 +177,14 @@ class SecretsManager:
                 if self._registry_override:
                     logger.warning("Token registry file disappeared: %s", self._registry_file)
                     self._registry_override = {}
-                self._registry_file_mtime = None
+                    changed = True
+                self._registry_file_signature = None
             else:
-                if self._registry_file_mtime != stat.st_mtime:
+                signature = (stat.st_mtime_ns, stat.st_size)
+                if self._registry_file_signature != signature:
                     self._registry_override = self._load_registry_override()
-                    self._registry_file_mtime = stat.st_mtime
+                    self._registry_file_signature = signature
+                    changed = True
         if self._token_file:
             try:
                 stat = self._token_file.stat()
@@ -160,11 +192,15 @@ class SecretsManager:
                 if self._token_file_entry:
                     logger.warning("Token file disappeared: %s", self._token_file)
                     self._token_file_entry = {}
-                self._token_file_mtime = None
+                    changed = True
+                self._token_file_signature = None
             else:
-                if self._token_file_mtime != stat.st_mtime:
+                signature = (stat.st_mtime_ns, stat.st_size)
+                if self._token_file_signature != signature:
                     self._token_file_entry = self._load_token_file_entry()
-                    self._token_file_mtime = stat.st_mtime
+                    self._token_file_signature = signature
+                    changed = True
+        return changed
 
     def _compose_registry_locked(self) -> dict[str, dict[str, Any]]:
         registry = dict(self._base_registry)
@@ -213,25 +249,41 @@ class SecretsManager:
 
     # ----------------------------------------------------------- signing keys
     def get_signing_keys(self) -> SigningKeySet:
+        snapshot = self._signing_snapshot
+        if snapshot is not None and time.monotonic() - snapshot[0] < self._stat_ttl:
+            return snapshot[1]
         with self._lock:
-            self._refresh_signing_keys_locked()
-            primary, all_keys = self._compose_signing_keys_locked()
-        return SigningKeySet(primary=primary, all_keys=all_keys)
+            snapshot = self._signing_snapshot
+            now = time.monotonic()
+            if snapshot is not None and now - snapshot[0] < self._stat_ttl:
+                return snapshot[1]
+            changed = self._refresh_signing_keys_locked()
+            if changed or snapshot is None:
+                primary, all_keys = self._compose_signing_keys_locked()
+                keys = SigningKeySet(primary=primary, all_keys=all_keys)
+            else:
+                keys = snapshot[1]
+            self._signing_snapshot = (now, keys)
+            return keys
 
-    def _refresh_signing_keys_locked(self) -> None:
+    def _refresh_signing_keys_locked(self) -> bool:
         if not self._signing_key_file:
-            return
+            return False
         try:
             stat = self._signing_key_file.stat()
         except FileNotFoundError:
+            self._signing_key_file_signature = None
             if self._signing_key_file_keys:
                 logger.warning("Signing key file disappeared: %s", self._signing_key_file)
                 self._signing_key_file_keys = ()
-            self._signing_key_file_mtime = None
-        else:
-            if self._signing_key_file_mtime != stat.st_mtime:
-                self._signing_key_file_keys = self._load_signing_key_file()
-                self._signing_key_file_mtime = stat.st_mtime
+                return True
+            return False
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if self._signing_key_file_signature == signature:
+            return False
+        self._signing_key_file_keys = self._load_signing_key_file()
+        self._signing_key_file_signature = signature
+        return True
 
     def _load_signing_key_file(self) -> tuple[str, ...]:
         try:
@@ -243,16 +295,16 @@ class SecretsManager:
         return tuple(dict.fromkeys(keys))  # preserve order, drop duplicates
 
     def _compose_signing_keys_locked(self) -> tuple[Optional[str], tuple[str, ...]]:
-        keys: list[str] = []
         if self._signing_key_file_keys:
-            keys.extend(self._signing_key_file_keys)
+            current: tuple[str, ...] = self._signing_key_file_keys
         elif self._primary_signing_key:
-            keys.append(self._primary_signing_key)
-        for key in self._previous_signing_keys:
-            if key and key not in keys:
-                keys.append(key)
+            current = (self._primary_signing_key,)
+        else:
+            current = ()
+        # preserve order, drop duplicates; both sources are already free of blanks
+        keys = tuple(dict.fromkeys((*current, *self._previous_signing_keys)))
         primary = keys[0] if keys else None
-        return primary, tuple(keys)
+        return primary, keys
 
 
 __all__ = [
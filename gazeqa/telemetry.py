@@ -1,7 +1,22 @@
 """Shared telemetry interfaces for structured observability."""
 from __future__ import annotations
 
-from typing import Dict
+import atexit
+import logging
+import queue
+import threading
+import time
+import weakref
+from typing import Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+# Workflow events drive run status and metrics; they wait for queue space
+# instead of being dropped, and the terminal ones are delivered without
+# waiting out the batch window.
+_CRITICAL_PREFIX = "workflow."
+_TERMINAL_EVENTS = frozenset({"workflow.completed", "workflow.failed"})
 
 
 class TelemetrySink:
@@ -10,6 +25,12 @@ class TelemetrySink:
     def emit(self, event: str, payload: Dict[str, object]) -> None:  # pragma: no cover - interface only
         raise NotImplementedError
 
+    def emit_many(self, events: Iterable[Tuple[str, Dict[str, object]]]) -> None:
+        """Emit a batch of events; sinks with batched transports may override this."""
+
+        for event, payload in events:
+            self.emit(event, payload)
+
 
 class NoOpTelemetry(TelemetrySink):
     """Telemetry sink that ignores all events."""
@@ -18,5 +39,184 @@ class NoOpTelemetry(TelemetrySink):
         return
 
 
-__all__ = ["TelemetrySink", "NoOpTelemetry"]
+class TelemetryBatcher:
+    """Delivers queued ``(event, payload)`` pairs to ``sink`` from a daemon thread.
+
+    Batches hold up to ``batch_size`` events gathered within ``batch_window``
+    seconds (``0`` takes only what is already queued) and go through the
+    sink's ``emit_many`` when it has one; an event in ``flush_on`` closes its
+    batch early. The worker starts on the first ``put``; with ``idle_seconds``
+    it exits after that long without events and the next ``put`` restarts it.
+    """
+
+    def __init__(
+        self,
+        sink: TelemetrySink,
+        *,
+        name: str,
+        max_queue: int = 1024,
+        batch_size: int = 50,
+        batch_window: float = 0.1,
+        flush_on: frozenset[str] = frozenset(),
+        idle_seconds: Optional[float] = None,
+    ) -> None:
+        self.sink = sink
+        self.name = name
+        self.batch_size = batch_size
+        self.batch_window = batch_window
+        self.flush_on = flush_on
+        self.idle_seconds = idle_seconds
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def put(self, event: str, payload: Dict[str, object], *, block: bool = False) -> bool:
+        """Queue an event; returns False when it was dropped or the batcher is closed."""
+
+        if self._closed:
+            return False
+        try:
+            self._queue.put((event, payload), block=block)
+        except queue.Full:
+            return False
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+        return True
+
+    def join(self) -> None:
+        """Block until every queued event has been handed to the sink."""
+
+        self._queue.join()
+
+    def close(self) -> None:
+        """Deliver queued events and stop the worker."""
+
+        self._closed = True
+        with self._lock:
+            thread = self._thread
+            if thread is not None:
+                self._queue.put(_STOP)
+        if thread is not None:
+            thread.join()
+
+    def _run(self) -> None:
+        events = self._queue
+        emit_many = getattr(self.sink, "emit_many", None)
+        while True:
+            try:
+                item = events.get(timeout=self.idle_seconds)
+            except queue.Empty:
+                with self._lock:
+                    if events.empty():
+                        self._thread = None
+                        return
+                continue
+            stop = item is _STOP
+            batch = [] if stop else [item]
+            deadline = time.monotonic() + self.batch_window
+            while not stop and len(batch) < self.batch_size and batch[-1][0] not in self.flush_on:
+                remaining = deadline - time.monotonic()
+                try:
+                    item = events.get(timeout=remaining) if remaining > 0 else events.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                else:
+                    batch.append(item)
+            try:
+                if emit_many is not None and len(batch) > 1:
+                    emit_many(batch)
+                else:
+                    for event, payload in batch:
+                        self.sink.emit(event, payload)
+            except Exception:  # pragma: no cover - telemetry best effort
+                logger.warning("%s failed to deliver %d telemetry events", self.name, len(batch), exc_info=True)
+            finally:
+                for _ in range(len(batch) + stop):
+                    events.task_done()
+            if stop:
+                with self._lock:
+                    self._thread = None
+                return
+
+
+class AsyncTelemetrySink(TelemetrySink):
+    """Hands events to ``delegate`` through a :class:`TelemetryBatcher`.
+
+    ``emit`` only enqueues, in order, on a queue bounded by ``max_queue``.
+    When the queue is full, non-workflow events are dropped.
+    """
+
+    def __init__(
+        self,
+        delegate: TelemetrySink,
+        *,
+        max_queue: int = 1024,
+        batch_size: int = 50,
+        buffer_seconds: float = 0.1,
+    ) -> None:
+        self.delegate = delegate
+        self._batcher: Optional[TelemetryBatcher] = TelemetryBatcher(
+            delegate,
+            name="telemetry-async",
+            max_queue=max_queue,
+            batch_size=batch_size,
+            batch_window=buffer_seconds,
+            flush_on=_TERMINAL_EVENTS,
+        )
+        flush_at_exit(self)
+
+    def emit(self, event: str, payload: Dict[str, object]) -> None:
+        batcher = self._batcher
+        if batcher is None:
+            self.delegate.emit(event, payload)
+            return
+        # The worker may still be forwarding the caller's dict, so it gets its own.
+        if not batcher.put(event, dict(payload), block=event.startswith(_CRITICAL_PREFIX)):
+            logger.debug("Telemetry queue full; dropping event %s", event)
+
+    def flush(self) -> None:
+        """Wait for queued events to reach the delegate, then flush it too."""
+
+        if self._batcher is not None:
+            self._batcher.join()
+        flush = getattr(self.delegate, "flush", None)
+        if flush is not None:
+            flush()
+
+    def close(self) -> None:
+        """Deliver queued events, stop the worker and close the delegate."""
+
+        batcher, self._batcher = self._batcher, None
+        if batcher is not None:
+            batcher.close()
+        close = getattr(self.delegate, "close", None)
+        if close is not None:
+            close()
+        else:
+            self.flush()
+
+
+_LIVE_SINKS: "weakref.WeakSet[TelemetrySink]" = weakref.WeakSet()
+
+
+def flush_at_exit(sink: TelemetrySink) -> None:
+    """Call ``sink.flush()`` at interpreter exit while the sink is still alive."""
+
+    _LIVE_SINKS.add(sink)
+
+
+@atexit.register
+def _flush_live_sinks() -> None:
+    for sink in list(_LIVE_SINKS):
+        try:
+            sink.flush()  # type: ignore[attr-defined]
+        except Exception:  # pragma: no cover - best effort at shutdown
+            logger.debug("Failed to flush telemetry sink at exit", exc_info=True)
+
 
+__all__ = ["AsyncTelemetrySink", "NoOpTelemetry", "TelemetryBatcher", "TelemetrySink", "flush_at_exit"]
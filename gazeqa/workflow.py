@@ -2,14 +2,17 @@
 from __future__ import annotations
 
 import logging
+import random
+import threading
 import time
 from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
 from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from .bfs import BFSCrawler, CrawlResult
-from .models import CreateRunPayload
-from .telemetry import TelemetrySink, NoOpTelemetry
 from .exploration import ExplorationEngine, ExplorationResult, PageDescriptor
+from .json_utils import safe_metadata
 from .models import CreateRunPayload
 from .observability import RunObservability
 from .run_service import RunService
@@ -29,24 +32,114 @@ class RetryableWorkflowError(WorkflowError):
 
 @dataclass(slots=True)
 class RetryPolicy:
-    """Defines retry behaviour for workflow activities."""
+    """Defines retry behaviour for workflow activities.
+
+    Delays grow exponentially from ``initial_interval`` by ``multiplier`` up to
+    ``max_interval``, each scaled by a random factor within ``jitter`` of 1 so
+    concurrent runs do not retry in lockstep. ``initial_interval`` defaults to
+    0, which retries immediately; set it to opt into backoff. An explicit
+    ``backoff_seconds`` table replaces the computed delays.
+    """
 
     max_attempts: int = 3
-    backoff_seconds: Sequence[float] = (0.0, 0.0, 0.0)
+    backoff_seconds: Optional[Sequence[float]] = None
+    initial_interval: float = 0.0
+    max_interval: float = 30.0
+    multiplier: float = 2.0
+    jitter: float = 0.1
 
     def sleep_for(self, attempt: int) -> float:
-        if not self.backoff_seconds:
-            return 0.0
-        index = min(max(0, attempt - 1), len(self.backoff_seconds) - 1)
-        return float(self.backoff_seconds[index])
+        """Return the delay before retrying after failed attempt ``attempt`` (1-based)."""
+
+        if self.backoff_seconds is not None:
+            if not self.backoff_seconds:
+                return 0.0
+            index = min(max(0, attempt - 1), len(self.backoff_seconds) - 1)
+            return float(self.backoff_seconds[index])
+        delay = min(self.max_interval, self.initial_interval * self.multiplier ** max(0, attempt - 1))
+        if self.jitter:
+            delay *= random.uniform(1.0 - self.jitter, 1.0 + self.jitter)
+        return max(0.0, delay)
+
+
+# (monotonic time of the oldest entry, [(checkpoint, details, timestamp), ...])
+_PendingBatch = Tuple[float, List[Tuple[str, Dict[str, Any], str]]]
+
+
+class CheckpointBatcher:
+    """Buffers workflow checkpoints per run and writes each batch in one call.
+
+    Entries keep the timestamp they were recorded at. A run's batch is written
+    on ``flush`` or once it holds ``max_batch`` entries or its oldest entry is
+    ``max_age_seconds`` old.
+    """
+
+    def __init__(
+        self,
+        run_service: RunService,
+        *,
+        max_batch: int = 100,
+        max_age_seconds: float = 5.0,
+    ) -> None:
+        self.run_service = run_service
+        self.max_batch = max_batch
+        self.max_age_seconds = max_age_seconds
+        self._pending: Dict[str, _PendingBatch] = {}
+        self._lock = threading.Lock()
+
+    def record(self, run_id: str, checkpoint: str, details: Optional[Dict[str, Any]] = None) -> None:
+        entry = (checkpoint, details or {}, datetime.now(timezone.utc).isoformat())
+        now = time.monotonic()
+        with self._lock:
+            pending = self._pending.get(run_id)
+            if pending is None:
+                pending = self._pending[run_id] = (now, [])
+            pending[1].append(entry)
+            due = len(pending[1]) >= self.max_batch or now - pending[0] >= self.max_age_seconds
+        if due:
+            self.flush(run_id)
+
+    def flush(self, run_id: str | None = None) -> None:
+        """Write buffered checkpoints for ``run_id``, or for every run."""
+
+        with self._lock:
+            if run_id is None:
+                batches = list(self._pending.items())
+                self._pending.clear()
+            else:
+                pending = self._pending.pop(run_id, None)
+                batches = [(run_id, pending)] if pending is not None else []
+        for index, (batch_run_id, (_, entries)) in enumerate(batches):
+            try:
+                self.run_service.record_checkpoints(batch_run_id, entries)
+            except Exception:
+                # Unwritten batches go back ahead of anything recorded since,
+                # so a later flush retries them in order.
+                self._restore(batches[index:])
+                raise
+
+    def _restore(self, batches: List[Tuple[str, _PendingBatch]]) -> None:
+        with self._lock:
+            for run_id, (started, entries) in batches:
+                newer = self._pending.get(run_id)
+                if newer is not None:
+                    entries = entries + newer[1]
+                self._pending[run_id] = (started, entries)
 
 
 class TemporalTaskRunner:
     """Lightweight simulation of Temporal retries and checkpointing."""
 
-    def __init__(self, run_service: RunService, default_policy: RetryPolicy | None = None) -> None:
+    def __init__(
+        self,
+        run_service: RunService,
+        default_policy: RetryPolicy | None = None,
+        *,
+        checkpoints: CheckpointBatcher | None = None,
+    ) -> None:
         self.run_service = run_service
         self.default_policy = default_policy or RetryPolicy()
+        self.checkpoints = checkpoints or CheckpointBatcher(run_service)
 
     def run_activity(
         self,
@@ -59,12 +152,15 @@ class TemporalTaskRunner:
         success_metadata_fn: Callable[[Any], Dict[str, Any]] | None = None,
     ) -> Any:
         policy = policy or self.default_policy
+        checkpoints = self.checkpoints
         last_error: Optional[BaseException] = None
+        # Checkpoints are buffered for the activity and written when it ends,
+        # fails, or is about to sleep before a retry.
         for attempt in range(1, policy.max_attempts + 1):
             attempt_payload = {"attempt": attempt}
             if attempt_metadata:
-                attempt_payload.update(_safe_metadata(attempt_metadata))
-            self.run_service.record_checkpoint(run_id, f"{name}.attempt", attempt_payload)
+                attempt_payload.update(safe_metadata(attempt_metadata))
+            checkpoints.record(run_id, f"{name}.attempt", attempt_payload)
             start_time = time.monotonic()
             try:
                 result = func()
@@ -75,13 +171,15 @@ class TemporalTaskRunner:
                     "error": str(exc),
                     "exception": exc.__class__.__name__,
                 }
-                self.run_service.record_checkpoint(run_id, f"{name}.retry", retry_payload)
+                checkpoints.record(run_id, f"{name}.retry", retry_payload)
                 if attempt >= policy.max_attempts:
                     failure_payload = retry_payload.copy()
-                    self.run_service.record_checkpoint(run_id, f"{name}.failed", failure_payload)
+                    checkpoints.record(run_id, f"{name}.failed", failure_payload)
+                    checkpoints.flush(run_id)
                     raise
-                sleep_for = policy.sleep_for(attempt + 1)
+                sleep_for = policy.sleep_for(attempt)
                 if sleep_for > 0:
+                    checkpoints.flush(run_id)
                     time.sleep(sleep_for)
                 continue
             except Exception as exc:
@@ -91,7 +189,8 @@ class TemporalTaskRunner:
                     "error": str(exc),
                     "exception": exc.__class__.__name__,
                 }
-                self.run_service.record_checkpoint(run_id, f"{name}.failed", failure_payload)
+                checkpoints.record(run_id, f"{name}.failed", failure_payload)
+                checkpoints.flush(run_id)
                 raise
             duration_ms = round((time.monotonic() - start_time) * 1000, 2)
             success_payload = {"attempt": attempt, "duration_ms": duration_ms}
@@ -101,24 +200,15 @@ class TemporalTaskRunner:
                 except Exception as exc:  # pragma: no cover - defensive logging
                     logger.exception("success_metadata_fn failed for %s", name)
                     extra = {"metadata_error": str(exc)}
-                success_payload.update(_safe_metadata(extra))
-            self.run_service.record_checkpoint(run_id, f"{name}.succeeded", success_payload)
+                success_payload.update(safe_metadata(extra))
+            checkpoints.record(run_id, f"{name}.succeeded", success_payload)
+            checkpoints.flush(run_id)
             return result
         if last_error:
             raise last_error
         raise WorkflowError(f"Activity {name} did not complete but no error captured")
 
 
-def _safe_metadata(metadata: Dict[str, Any]) -> Dict[str, Any]:
-    safe: Dict[str, Any] = {}
-    for key, value in metadata.items():
-        if isinstance(value, (str, int, float, bool)) or value is None:
-            safe[key] = value
-        else:
-            safe[key] = str(value)
-    return safe
-
-
 class RunWorkflow:
     """Coordinates auth, exploration, and crawl phases with retry semantics."""
 
@@ -139,7 +229,8 @@ class RunWorkflow:
         self.auth_orchestrator = auth_orchestrator
         self.exploration_engine = exploration_engine
         self.crawler = crawler
-        self.temporal = TemporalTaskRunner(run_service, retry_policy)
+        self.checkpoints = CheckpointBatcher(run_service)
+        self.temporal = TemporalTaskRunner(run_service, retry_policy, checkpoints=self.checkpoints)
         self.telemetry = telemetry or RunObservability(run_service.storage_root)
         self.site_map_builder = site_map_builder
         self._bind_component_telemetry()
@@ -165,6 +256,7 @@ class RunWorkflow:
         manifest = self.run_service.get_run(run_id)
         payload = CreateRunPayload.from_dict(manifest)
         resolved_site_map, resolved_adjacency = self._resolve_site_map(run_id, site_map, adjacency, payload)
+        run_dir = self.run_service.get_run_directory(run_id)
         self._record_checkpoint(run_id, "workflow.started", {"target_url": payload.target_url})
         self._emit("workflow.started", {"run_id": run_id, "target_url": payload.target_url})
         phase = "initializing"
@@ -188,7 +280,7 @@ class RunWorkflow:
                 auth_result = self.temporal.run_activity(
                     run_id,
                     "auth",
-                    lambda: self._execute_auth(run_id, payload),
+                    lambda: self._execute_auth(run_id, payload, run_dir),
                     attempt_metadata={"phase": phase},
                     success_metadata_fn=lambda result: {
                         "stage": result.get("stage"),
@@ -213,7 +305,7 @@ class RunWorkflow:
             exploration_result = self.temporal.run_activity(
                 run_id,
                 "exploration",
-                lambda: self.exploration_engine.explore(run_id, resolved_site_map),
+                lambda: self.exploration_engine.explore(run_id, resolved_site_map, run_dir=run_dir),
                 attempt_metadata={"phase": phase},
                 success_metadata_fn=lambda result: {
                     "coverage_percent": result.coverage_percent,
@@ -244,7 +336,7 @@ class RunWorkflow:
             crawl_result = self.temporal.run_activity(
                 run_id,
                 "crawl",
-                lambda: self.crawler.crawl(run_id, seeds, resolved_adjacency),
+                lambda: self.crawler.crawl(run_id, seeds, resolved_adjacency, run_dir=run_dir),
                 attempt_metadata={"phase": phase},
                 success_metadata_fn=lambda result: {
                     "visited_count": len(result.visited),
@@ -303,12 +395,14 @@ class RunWorkflow:
                 {"run_id": run_id, "phase": phase, "error": str(exc), "exception": exc.__class__.__name__},
             )
             raise
+        finally:
+            self.checkpoints.flush(run_id)
+            self.run_service.flush_run(run_id)
 
-    def _execute_auth(self, run_id: str, payload: CreateRunPayload) -> Dict[str, Any]:
+    def _execute_auth(self, run_id: str, payload: CreateRunPayload, run_dir: Path) -> Dict[str, Any]:
         credentials = payload.credentials
         if credentials.is_empty():
             raise WorkflowError("No credentials provided for authentication phase")
-        run_dir = self.run_service.get_run_directory(run_id)
         result = self.auth_orchestrator.authenticate(
             run_id,
             credentials,
@@ -322,11 +416,11 @@ class RunWorkflow:
         return result
 
     def _record_checkpoint(self, run_id: str, name: str, details: Dict[str, Any]) -> None:
-        self.run_service.record_checkpoint(run_id, name, _safe_metadata(details))
+        self.checkpoints.record(run_id, name, safe_metadata(details, copy=True))
 
     def _emit(self, event: str, payload: Dict[str, Any]) -> None:
         try:
-            self.telemetry.emit(event, _safe_metadata(payload))
+            self.telemetry.emit(event, safe_metadata(payload, copy=True))
         except Exception:  # pragma: no cover - defensive logging
             logger.exception("telemetry emit failed for %s", event)
 
@@ -355,6 +449,7 @@ class RunWorkflow:
 
 
 __all__ = [
+    "CheckpointBatcher",
     "RunWorkflow",
     "RetryPolicy",
     "TemporalTaskRunner",
@@ -95,6 +95,16 @@ def test_get_runs_pagination_and_events(tmp_path: Path) -> None:
         body = json.loads(resp.read().decode("utf-8"))
     assert body["run_id"] == run_id
     assert any(evt["status"] == "Completed" for evt in body.get("events", []))
+    # The background workflow may still be appending, so only the head is stable.
+    with _request(f"{events_list_url}?limit=1") as resp:
+        head_body = json.loads(resp.read().decode("utf-8"))
+    assert head_body["events"] == body["events"][:1]
+    try:
+        _request(f"{events_list_url}?since=abc")
+    except urllib.error.HTTPError as exc:
+        assert exc.code == 400
+    else:  # pragma: no cover
+        assert False, "expected 400 for an invalid since"
 
     stream_url = f"{base}/runs/{run_id}/events/stream"
     stream_req = urllib.request.Request(stream_url, headers={"Authorization": f"Bearer {API_TOKEN}"})
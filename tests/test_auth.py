@@ -10,6 +10,9 @@ from gazeqa.auth import (
     AuthAttempt,
     AuthenticationOrchestrator,
     AuthConfig,
+    AuthenticationError,
+    _click_first_selector,
+    _fill_first_selector,
     decrypt_storage_state,
 )
 from gazeqa.models import CredentialSpec
@@ -64,6 +67,11 @@ def test_auth_success_primary(temp_root: Path):
     decrypted = decrypt_storage_state(encrypted_path, config.encryption_key)
     assert "session=abc" in decrypted
 
+    result["evidence"].append("extra.log")
+    result["metadata"]["note"] = "changed"
+    assert "extra.log" not in result["attempts"][-1]["evidence"]
+    assert "note" not in result["attempts"][-1]["metadata"]
+
 
 def test_auth_fallback(temp_root: Path):
     config = build_config(temp_root)
@@ -74,3 +82,42 @@ def test_auth_fallback(temp_root: Path):
 
     assert result["stage"] == "fallback"
     assert result["success"] is True
+
+
+class FakeLocator:
+    def __init__(self, page, selector):
+        self.page = page
+        self.selector = selector
+
+    @property
+    def first(self):
+        return self
+
+    def fill(self, value, timeout):
+        self._act("fill")
+
+    def click(self, timeout):
+        self._act("click")
+
+    def _act(self, action):
+        if self.selector not in self.page.present:
+            raise TimeoutError(self.selector)
+        self.page.actions.append((action, self.selector))
+
+
+class FakePage:
+    def __init__(self, present):
+        self.present = set(present)
+        self.actions = []
+
+    def locator(self, selector):
+        return FakeLocator(self, selector)
+
+
+def test_selectors_are_tried_in_priority_order():
+    page = FakePage({"input[name=email]", "text=Sign in", "button[type=submit]"})
+    _fill_first_selector(page, ("#missing", "input[name=email]"), "user@example.com")
+    _click_first_selector(page, ("text=Sign in", "button[type=submit]"))
+    assert page.actions == [("fill", "input[name=email]"), ("click", "text=Sign in")]
+    with pytest.raises(AuthenticationError):
+        _click_first_selector(page, ("#absent", "xpath=//button"))
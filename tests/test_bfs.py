@@ -3,6 +3,7 @@ from pathlib import Path
 
 from gazeqa.bfs import BFSCrawler, CrawlConfig
 from gazeqa.exploration import PageDescriptor
+from gazeqa.telemetry import TelemetrySink
 
 
 def _page(page_id: str, url: str, title: str, section: str = "") -> PageDescriptor:
@@ -68,3 +69,21 @@ def test_bfs_guardrail_blocklist(tmp_path: Path) -> None:
     entries = [json.loads(line) for line in guardrail_path.read_text().splitlines() if line.strip()]
     assert any(entry["type"] == "blocklist" for entry in entries)
     assert any(record.reason == "destructive_blocklist" for record in result.skipped)
+
+
+def test_bfs_guardrail_telemetry_delivered_before_return(tmp_path: Path) -> None:
+    class RecordingSink(TelemetrySink):
+        def __init__(self) -> None:
+            self.events: list[str] = []
+
+        def emit(self, event: str, payload: dict) -> None:
+            self.events.append(event)
+
+    sink = RecordingSink()
+    crawler = BFSCrawler(CrawlConfig(storage_root=tmp_path, max_depth=1), telemetry=sink)
+    home = _page("home", "https://example.test/home", "Home")
+    drop_page = _page("drop", "https://example.test/db/drop", "Drop")
+
+    crawler.crawl("RUN-BFS-TEL", [home], {"home": [drop_page]})
+
+    assert sink.events == ["guardrail.blocklist"]
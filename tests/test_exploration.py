@@ -70,3 +70,27 @@ def test_exploration_blocklist_guardrail(tmp_path: Path) -> None:
     entries = [json.loads(line) for line in guardrail_path.read_text().splitlines() if line.strip()]
     assert any(entry["type"] == "blocklist" for entry in entries)
     assert any(page.url.endswith("/admin/delete") for page in result.skipped_pages)
+
+
+def test_exploration_budget_avoids_float_drift(tmp_path: Path) -> None:
+    pages = [
+        PageDescriptor(url=f"https://example.test/p{i}", title=f"P{i}", section="detail")
+        for i in range(100)
+    ]
+    engine = ExplorationEngine(ExplorationConfig(coverage_threshold=0.29, storage_root=tmp_path))
+    result = engine.explore("RUN-EXP-DRIFT", pages)
+
+    assert len(result.visited_pages) == 29
+    assert result.coverage_percent == 0.29
+
+
+def test_exploration_blocklist_reports_first_configured_keyword(tmp_path: Path) -> None:
+    engine = ExplorationEngine(ExplorationConfig(coverage_threshold=1.0, storage_root=tmp_path))
+    pages = [
+        PageDescriptor(url="https://example.test/remove/delete", title="Cleanup", section="admin"),
+    ]
+
+    engine.explore("RUN-EXP-KW", pages)
+    guardrail_path = tmp_path / "RUN-EXP-KW" / "exploration" / "guardrails.jsonl"
+    entries = [json.loads(line) for line in guardrail_path.read_text().splitlines() if line.strip()]
+    assert entries[0]["keyword"] == "delete"
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+from gazeqa.file_utils import atomic_write_bytes, atomic_writer
+
+
+def test_concurrent_atomic_writes_to_one_target(tmp_path: Path) -> None:
+    target = tmp_path / "run_manifest.json"
+    errors: list[BaseException] = []
+
+    def writer(marker: bytes) -> None:
+        try:
+            for index in range(500):
+                if index % 2:
+                    atomic_write_bytes(target, marker * 64)
+                else:
+                    with atomic_writer(target) as handle:
+                        handle.write(marker * 64)
+        except BaseException as exc:  # pragma: no cover - reported below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=writer, args=(bytes([65 + n]),)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    content = target.read_bytes()
+    assert len(content) == 64 and len(set(content)) == 1
+    assert [path.name for path in tmp_path.iterdir()] == ["run_manifest.json"]
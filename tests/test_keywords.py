@@ -0,0 +1,11 @@
+from gazeqa.keywords import KeywordMatcher
+
+
+def test_keyword_matcher_reports_first_configured_keyword() -> None:
+    matcher = KeywordMatcher(("Delete", "", "remove"))
+    assert matcher.keywords == ("delete", "remove")
+    assert matcher.first_match("/items/remove", "delete item") == "delete"
+    assert matcher.first_match("/items", "list") is None
+    assert matcher.matches("/remove")
+    assert not KeywordMatcher(()).matches("/remove")
+    assert KeywordMatcher(()).first_match("/remove") is None
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import json
+import time
 from pathlib import Path
 
+from gazeqa.langfuse import LangfuseClient
 from gazeqa.observability import RunObservability
+from gazeqa.telemetry import AsyncTelemetrySink, TelemetryBatcher
 
 
 class StubLangfuse:
@@ -17,7 +21,71 @@ def test_run_observability_forwards_langfuse(tmp_path: Path) -> None:
     stub = StubLangfuse()
     telemetry = RunObservability(storage_root=tmp_path, langfuse_client=stub)
     telemetry.emit("workflow.completed", {"run_id": "RUN-TEST-123", "timestamp": "2025-01-01T00:00:00Z"})
+    telemetry.flush()
     assert stub.calls
     event, payload = stub.calls[0]
     assert event == "workflow.completed"
     assert payload["run_id"] == "RUN-TEST-123"
+
+
+def test_async_sink_delivers_in_order_on_flush(tmp_path: Path) -> None:
+    stub = StubLangfuse()
+    telemetry = AsyncTelemetrySink(stub, buffer_seconds=0.01)  # type: ignore[arg-type]
+    for index in range(5):
+        telemetry.emit("crawl.page", {"run_id": "RUN-TEST-123", "index": index})
+    telemetry.emit("workflow.failed", {"run_id": "RUN-TEST-123"})
+    telemetry.flush()
+    assert [event for event, _ in stub.calls] == ["crawl.page"] * 5 + ["workflow.failed"]
+    assert [payload.get("index") for _, payload in stub.calls[:5]] == list(range(5))
+    telemetry.close()
+    telemetry.emit("workflow.completed", {"run_id": "RUN-TEST-123"})
+    assert stub.calls[-1][0] == "workflow.completed"
+
+
+def test_batcher_restarts_after_idle_exit() -> None:
+    stub = StubLangfuse()
+    batcher = TelemetryBatcher(stub, name="test-batcher", batch_window=0, idle_seconds=0.01)  # type: ignore[arg-type]
+    assert batcher.put("crawl.page", {"index": 0})
+    batcher.join()
+    time.sleep(0.05)
+    assert batcher.put("crawl.page", {"index": 1})
+    batcher.join()
+    assert [payload["index"] for _, payload in stub.calls] == [0, 1]
+    batcher.close()
+    assert not batcher.put("crawl.page", {"index": 2})
+
+
+def test_langfuse_client_posts_one_span_per_event(tmp_path: Path) -> None:
+    client = LangfuseClient("https://langfuse.test", "pk", "sk", environment="test")
+    posted: list[dict] = []
+    client._send = lambda data: posted.append(json.loads(data)) or 200  # type: ignore[method-assign]
+    telemetry = RunObservability(storage_root=tmp_path, langfuse_client=client, langfuse_async=False)
+    for index in range(2):
+        telemetry.emit("crawl.page", {"run_id": "RUN-TEST-123", "index": index, "timestamp": "2025-01-01T00:00:00Z"})
+    assert [body["metadata"]["index"] for body in posted] == [0, 1]
+    assert posted[0]["traceId"] == "RUN-TEST-123"
+    assert posted[0]["name"] == "crawl.page"
+    assert posted[0]["environment"] == "test"
+    assert posted[0]["timestamp"] == "2025-01-01T00:00:00Z"
+    assert "batch" not in posted[0]
+    telemetry.close()
+
+
+def test_from_env_client_follows_environment(monkeypatch) -> None:
+    monkeypatch.setenv("LANGFUSE_PUBLIC_KEY", "pk")
+    monkeypatch.setenv("LANGFUSE_SECRET_KEY", "sk-1")
+    first = LangfuseClient.from_env()
+    assert first is not None
+    assert LangfuseClient.from_env() is first
+
+    monkeypatch.setenv("LANGFUSE_SECRET_KEY", "sk-2")
+    rotated = LangfuseClient.from_env()
+    assert rotated is not first
+    assert rotated is not None and rotated.secret_key == "sk-2"
+
+    class CustomClient(LangfuseClient):
+        pass
+
+    assert type(CustomClient.from_env()) is CustomClient
+    monkeypatch.delenv("LANGFUSE_SECRET_KEY")
+    assert LangfuseClient.from_env() is None
@@ -1,7 +1,10 @@
 import json
 from pathlib import Path
 
-from tools.run_summary_to_metrics import iter_metrics
+import pytest
+
+from gazeqa.observability import RunObservability
+from tools.run_summary_to_metrics import iter_metrics, load_observability
 
 
 def test_iter_metrics_includes_observability(tmp_path: Path) -> None:
@@ -29,3 +32,17 @@ def test_iter_metrics_includes_observability(tmp_path: Path) -> None:
         item for item in metrics if item[0] == "gazeqa_guardrail_events_total" and item[1]["type"] == "blocklist"
     )
     assert guardrail_metric[2] == 2.0
+
+
+def test_load_observability_follows_cbor_stub(tmp_path: Path) -> None:
+    pytest.importorskip("cbor2")
+    telemetry = RunObservability(storage_root=tmp_path, metrics_format="cbor")
+    telemetry.emit("crawl.completed", {"run_id": "RUN-TEST", "visited_count": 3, "skipped_count": 1})
+    telemetry.close()
+    obs_dir = tmp_path / "RUN-TEST" / "observability"
+
+    stub = json.loads((obs_dir / "metrics.json").read_text(encoding="utf-8"))
+    assert stub["format"] == "cbor" and stub["path"] == "metrics.cbor"
+    from_stub = load_observability(obs_dir / "metrics.json")
+    assert from_stub == load_observability(obs_dir / "metrics.cbor")
+    assert from_stub["crawl"]["visited_count"] == 3
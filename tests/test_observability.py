@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+
+from gazeqa import observability
+from gazeqa.observability import RunObservability
+
+
+def test_metrics_written_after_burst_without_further_events(tmp_path: Path) -> None:
+    telemetry = RunObservability(storage_root=tmp_path, metrics_format="json")
+    telemetry.emit("crawl.completed", {"run_id": "RUN-TEST-123", "visited_count": 1, "skipped_count": 0})
+    telemetry.emit("crawl.completed", {"run_id": "RUN-TEST-123", "visited_count": 5, "skipped_count": 0})
+    metrics_path = tmp_path / "RUN-TEST-123" / "observability" / "metrics.json"
+
+    deadline = time.monotonic() + observability._METRICS_FLUSH_INTERVAL + 2.0
+    while time.monotonic() < deadline:
+        if json.loads(metrics_path.read_bytes())["crawl"]["visited_count"] == 5:
+            break
+        time.sleep(0.05)
+    assert json.loads(metrics_path.read_bytes())["crawl"]["visited_count"] == 5
+    telemetry.close()
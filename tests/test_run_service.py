@@ -2,6 +2,7 @@ import json
 import shutil
 import tempfile
 import unittest
+from datetime import datetime
 from pathlib import Path
 
 from gazeqa.run_service import RunService, ValidationError
@@ -104,6 +105,22 @@ class RunServiceTests(unittest.TestCase):
         self.assertEqual(summary["auth"]["stage"], "cua")
         self.assertIn("auth/storageState.json.enc", summary["auth"]["evidence"])
 
+    def test_create_runs_bulk_indexes_every_run(self) -> None:
+        runs = self.service.create_runs_bulk(
+            [
+                {"target_url": "https://example.test/a"},
+                {"target_url": "https://example.test/b", "organization_slug": "acme-qa"},
+            ]
+        )
+        self.assertEqual(len({run["id"] for run in runs}), 2)
+        index = json.loads((self.temp_dir / "run_index.json").read_text())
+        self.assertEqual(index[runs[1]["id"]]["organization_slug"], "acme-qa")
+        self.assertEqual(self.service.get_run(runs[0]["id"])["target_url"], "https://example.test/a")
+
+        with self.assertRaises(ValidationError):
+            self.service.create_runs_bulk([{"target_url": "https://example.test"}, {"target_url": ""}])
+        self.assertEqual(len(self.service.list_runs()), 2)
+
     def test_update_status_updates_history(self) -> None:
         payload = {"target_url": "https://example.test"}
         run = self.service.create_run(payload)
@@ -116,6 +133,94 @@ class RunServiceTests(unittest.TestCase):
         manifest = self.service.get_run(run_id)
         self.assertEqual(manifest["status"], "Exploring")
 
+    def test_update_status_repeat_keeps_history_and_records_metadata(self) -> None:
+        run = self.service.create_run({"target_url": "https://example.test"})
+        run_id = run["id"]
+
+        self.service.update_status(run_id, "Exploring")
+        self.service.update_status(run_id, "Exploring", {"phase": "exploration"})
+
+        history = self.service.get_status_history(run_id)
+        self.assertEqual([entry["status"] for entry in history], ["Pending", "Running", "Exploring"])
+        # History is projected from events.jsonl, which is written through, so
+        # a fresh service sees the same entries without any flush.
+        self.assertEqual(RunService(storage_root=self.temp_dir).get_status_history(run_id), history)
+        self.assertFalse((self.service.get_run_directory(run_id) / "status_history.json").exists())
+        manifest = self.service.get_run(run_id)
+        self.assertEqual(manifest["status_metadata"], {"phase": "exploration"})
+
+    def test_get_artifact_path_rejects_sibling_prefix_directory(self) -> None:
+        run = self.service.create_run({"target_url": "https://example.test"})
+        run_dir = self.service.get_run_directory(run["id"])
+        sibling = run_dir.parent / f"{run_dir.name}-other"
+        sibling.mkdir()
+        (sibling / "secret.txt").write_text("nope", encoding="utf-8")
+
+        self.assertEqual(
+            self.service.get_artifact_path(run["id"], "run_summary.json"),
+            (run_dir / "run_summary.json").resolve(),
+        )
+        for relative in (f"../{sibling.name}/secret.txt", str(sibling / "secret.txt"), "auth/../.."):
+            with self.assertRaises(ValueError):
+                self.service.get_artifact_path(run["id"], relative)
+
+        (run_dir / "escape").symlink_to(sibling, target_is_directory=True)
+        with self.assertRaises(ValueError):
+            self.service.get_artifact_path(run["id"], "escape/secret.txt")
+
+    def test_run_ids_outside_a_single_path_component_are_not_found(self) -> None:
+        (self.temp_dir / "run_manifest.json").write_text("{}", encoding="utf-8")
+        for run_id in ("..", "../default", "", "RUN-1/.."):
+            with self.assertRaises(FileNotFoundError):
+                self.service.get_run(run_id)
+
+    def test_iter_run_events_supports_limit_tail_and_since(self) -> None:
+        run = self.service.create_run({"target_url": "https://example.test"})
+        run_id = run["id"]
+        for status in ("Exploring", "Crawling", "Completed"):
+            self.service.update_status(run_id, status)
+
+        events = self.service.get_run_events(run_id)
+        self.assertEqual(len(events), 4)
+        first_two = list(self.service.iter_run_events(run_id, limit=2))
+        self.assertEqual(first_two, events[:2])
+        last_two = list(self.service.iter_run_events(run_id, limit=2, tail=True))
+        self.assertEqual([event["status"] for event in last_two], ["Crawling", "Completed"])
+        newer = list(self.service.iter_run_events(run_id, since_ts=events[0]["timestamp"]))
+        self.assertTrue(all(event["timestamp"] > events[0]["timestamp"] for event in newer))
+
+    def test_iter_run_events_tail_counts_only_matching_events(self) -> None:
+        run = self.service.create_run({"target_url": "https://example.test"})
+        run_id = run["id"]
+        for status in ("Exploring", "Crawling"):
+            self.service.update_status(run_id, status)
+        events = self.service.get_run_events(run_id)
+        with (self.service.get_run_directory(run_id) / "events.jsonl").open("ab") as handle:
+            handle.write(b"\n{not json\n\n")
+
+        last_two = list(self.service.iter_run_events(run_id, limit=2, tail=True))
+        self.assertEqual(last_two, events[-2:])
+        newest = list(
+            self.service.iter_run_events(run_id, limit=5, since_ts=events[0]["timestamp"], tail=True)
+        )
+        self.assertEqual(newest, [event for event in events[1:] if event["timestamp"] > events[0]["timestamp"]])
+
+    def test_iter_run_events_compares_since_as_datetime(self) -> None:
+        run = self.service.create_run({"target_url": "https://example.test"})
+        run_id = run["id"]
+        self.service.update_status(run_id, "Exploring")
+        events = self.service.get_run_events(run_id)
+        created = datetime.fromisoformat(events[0]["timestamp"])
+
+        # "Z" and "+00:00" spell the same instant; string comparison disagrees.
+        since = created.replace(tzinfo=None).isoformat() + "Z"
+        newer = list(self.service.iter_run_events(run_id, since_ts=since))
+        expected = [event for event in events if datetime.fromisoformat(event["timestamp"]) > created]
+        self.assertEqual(newer, expected)
+        self.assertEqual(list(self.service.iter_run_events(run_id, since_ts="2000-01-01")), events)
+        with self.assertRaises(ValueError):
+            list(self.service.iter_run_events(run_id, since_ts="abc"))
+
     def test_listener_notified_on_status_change(self) -> None:
         payload = {"target_url": "https://example.test"}
         run = self.service.create_run(payload)
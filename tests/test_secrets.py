@@ -64,3 +64,17 @@ def test_signing_key_file_reload(tmp_path: Path) -> None:
     assert rotated.primary == "rotated-key"
     assert rotated.all_keys[0] == "rotated-key"
     assert "old-key" in rotated.all_keys
+
+
+def test_stat_ttl_defers_reload_checks(tmp_path: Path) -> None:
+    key_file = tmp_path / "signing.keys"
+    key_file.write_text("primary-key\n", encoding="utf-8")
+    manager = SecretsManager(default_token=None, signing_key_file=key_file, stat_ttl=3600)
+    assert manager.get_signing_keys().primary == "primary-key"
+
+    key_file.write_text("rotated-key\n", encoding="utf-8")
+    os.utime(key_file, (time.time() + 1, time.time() + 1))
+    assert manager.get_signing_keys().primary == "primary-key"
+
+    manager._signing_snapshot = None
+    assert manager.get_signing_keys().primary == "rotated-key"
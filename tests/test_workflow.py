@@ -1,11 +1,13 @@
 import json
 from pathlib import Path
 
+import pytest
+
 from gazeqa.bfs import BFSCrawler, CrawlConfig
 from gazeqa.exploration import ExplorationConfig, ExplorationEngine, PageDescriptor
 from gazeqa.run_service import RunService
 from gazeqa.observability import RunObservability
-from gazeqa.workflow import RetryPolicy, RetryableWorkflowError, RunWorkflow, WorkflowError
+from gazeqa.workflow import CheckpointBatcher, RetryPolicy, RetryableWorkflowError, RunWorkflow, WorkflowError
 
 
 class SuccessfulAuth:
@@ -148,6 +150,46 @@ def test_workflow_retries_auth_until_success(tmp_path: Path) -> None:
     assert history[-1]["status"] == "Completed"
 
 
+def test_retry_policy_backoff_grows_and_caps() -> None:
+    policy = RetryPolicy(initial_interval=1.0, max_interval=5.0, multiplier=2.0, jitter=0.0)
+    assert [policy.sleep_for(attempt) for attempt in range(1, 6)] == [1.0, 2.0, 4.0, 5.0, 5.0]
+
+    jittered = RetryPolicy(initial_interval=2.0, jitter=0.25)
+    assert all(1.5 <= jittered.sleep_for(1) <= 2.5 for _ in range(50))
+
+    assert [RetryPolicy().sleep_for(attempt) for attempt in (1, 2)] == [0.0, 0.0]
+
+    table = RetryPolicy(backoff_seconds=(0.5, 1.5))
+    assert [table.sleep_for(attempt) for attempt in (1, 2, 3)] == [0.5, 1.5, 1.5]
+
+
+def test_checkpoint_batcher_writes_on_flush_and_when_full(tmp_path: Path) -> None:
+    run_service = RunService(storage_root=tmp_path)
+    run_id = run_service.create_run({"target_url": "https://example.test"})["id"]
+    checkpoint_path = run_service.get_run_directory(run_id) / "temporal" / "checkpoints.jsonl"
+    batcher = CheckpointBatcher(run_service, max_batch=3)
+
+    batcher.record(run_id, "phase.one", {"attempt": 1})
+    batcher.record(run_id, "phase.two")
+    run_service.flush_run(run_id)
+    assert not checkpoint_path.exists()
+
+    batcher.record(run_id, "phase.three")
+    run_service.flush_run(run_id)
+    assert [entry["checkpoint"] for entry in _checkpoint_entries(checkpoint_path)] == [
+        "phase.one",
+        "phase.two",
+        "phase.three",
+    ]
+
+    batcher.record(run_id, "phase.four")
+    batcher.flush(run_id)
+    run_service.flush_run(run_id)
+    entries = _checkpoint_entries(checkpoint_path)
+    assert entries[-1]["checkpoint"] == "phase.four"
+    assert entries[0]["attempt"] == 1
+
+
 def test_workflow_failure_sets_failed_status(tmp_path: Path) -> None:
     auth = SuccessfulAuth()
     run_service = RunService(storage_root=tmp_path)
@@ -207,3 +249,27 @@ def test_workflow_skips_auth_when_orchestrator_missing(tmp_path: Path) -> None:
     auth_result = result["auth"]
     assert auth_result["stage"] == "skipped"
     assert auth_result["reason"] == "orchestrator_unavailable"
+
+
+def test_checkpoint_batcher_keeps_entries_when_write_fails(tmp_path: Path, monkeypatch) -> None:
+    run_service = RunService(storage_root=tmp_path)
+    run_id = run_service.create_run({"target_url": "https://example.test"})["id"]
+    checkpoint_path = run_service.get_run_directory(run_id) / "temporal" / "checkpoints.jsonl"
+    batcher = CheckpointBatcher(run_service)
+
+    def failing_write(_run_id, _entries):
+        raise OSError("disk full")
+
+    batcher.record(run_id, "phase.one")
+    with monkeypatch.context() as patch:
+        patch.setattr(run_service, "record_checkpoints", failing_write)
+        with pytest.raises(OSError):
+            batcher.flush(run_id)
+
+    batcher.record(run_id, "phase.two")
+    batcher.flush()
+    run_service.flush_run(run_id)
+    assert [entry["checkpoint"] for entry in _checkpoint_entries(checkpoint_path)] == [
+        "phase.one",
+        "phase.two",
+    ]
@@ -15,6 +15,18 @@ def load_json(path: Path) -> Any:
         return json.load(handle)
 
 
+def load_observability(path: Path) -> Any:
+    if path.suffix == ".cbor":
+        import cbor2
+
+        return cbor2.loads(path.read_bytes())
+    data = load_json(path)
+    # In CBOR mode metrics.json is a stub naming the file that holds the data.
+    if isinstance(data, dict) and data.get("format") == "cbor" and isinstance(data.get("path"), str):
+        return load_observability(path.parent / data["path"])
+    return data
+
+
 def to_float(value: int | float) -> float:
     return float(value)
 
@@ -166,7 +178,7 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--observability",
         type=Path,
-        help="Optional path to observability metrics.json produced during run execution.",
+        help="Optional path to observability metrics.json (or metrics.cbor) produced during run execution.",
     )
     parser.add_argument("--output", type=Path, required=True, help="Output path for Prometheus text-format metrics.")
     parser.add_argument("--append", action="store_true", help="Append to existing metrics file instead of overwriting.")
@@ -179,7 +191,7 @@ def main() -> int:
 
     run_data = load_json(args.run_summary)
     checklist = load_json(args.checklist) if args.checklist else None
-    observability = load_json(args.observability) if args.observability else None
+    observability = load_observability(args.observability) if args.observability else None
     metrics = iter_metrics(run_data, checklist, observability)
     write_metrics(metrics, args.output, append=args.append)
     return 0